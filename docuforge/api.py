@@ -6,7 +6,6 @@ import asyncio
 import json
 from pathlib import Path
 from typing import List, Optional, AsyncGenerator
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -43,8 +42,11 @@ def _startup_cleanup():
 
 # EXIT: Clean up all temp files when application closes
 def _exit_cleanup():
-    """Clean all temp files when application closes."""
-    import time
+    """
+    Clean all temp files when application closes.
+    Single non-blocking pass: anything still locked is removed by
+    SafeFileManager.cleanup_global_temp() on the next startup.
+    """
     import shutil
     
     temp_dir = Path("C:/Users/Public/DocuForge/Temp")
@@ -61,11 +63,6 @@ def _exit_cleanup():
                     except:
                         pass
     
-    # First cleanup
-    clean_dir()
-    # Wait for late file writes
-    time.sleep(2)
-    # Second cleanup (catches files written during delay)
     clean_dir()
 
 import atexit
@@ -620,6 +617,7 @@ def process_single_pdf_parallel(
     Now processes directly from original PDF - no temp files, no memory bloat.
     """
     import pdfplumber
+    import fitz
     import gc
     
     # Import processing components
@@ -650,7 +648,8 @@ def process_single_pdf_parallel(
     all_md_content = []
     
     # Open PDF ONCE and process page by page - NO temp files!
-    with pdfplumber.open(input_path) as pdf:
+    # PyMuPDF handle is used for the fast OCR pre-check text
+    with pdfplumber.open(input_path) as pdf, fitz.open(input_path) as fitz_doc:
         total_pages = len(pdf.pages)
         
         if progress_callback:
@@ -662,7 +661,7 @@ def process_single_pdf_parallel(
                 crop_box = zone_cleaner.get_crop_box(page)
                 
                 # B. Smart OCR / Text Extraction
-                raw_text_check = page.filter(lambda obj: obj["object_type"] == "char").extract_text() or ""
+                raw_text_check = fitz_doc[page_num - 1].get_text("text")
                 ocr_text = smart_ocr.process_page(input_path, page_num, raw_text_check)
                 
                 if ocr_text and ocr_text != raw_text_check:
@@ -706,13 +705,13 @@ def process_single_pdf_parallel(
                         charts_md.extend([link for link, bbox in chart_results])
                     
                     # Assembly
-                    page_md = f"\n\n## Page {page_num}\n"
-                    if charts_md: page_md += "\n" + "\n".join(charts_md) + "\n"
-                    if images_md: page_md += "\n" + "\n".join(images_md) + "\n"
-                    if tables_md: page_md += "\n" + "\n".join(tables_md) + "\n"
-                    page_md += f"\n{clean_text}\n"
+                    parts = [f"\n\n## Page {page_num}\n"]
+                    if charts_md: parts.extend(("\n", "\n".join(charts_md), "\n"))
+                    if images_md: parts.extend(("\n", "\n".join(images_md), "\n"))
+                    if tables_md: parts.extend(("\n", "\n".join(tables_md), "\n"))
+                    parts.append(f"\n{clean_text}\n")
                     
-                    all_md_content.append(page_md)
+                    all_md_content.append("".join(parts))
                     
                     # Cleanup per-page variables
                     del tables_md, charts_md, images_md, ignore_regions, structured_text, clean_text
@@ -827,17 +826,26 @@ async def convert_pdfs_stream(
                     validated_watermarks = analyzer.analyze()
                     
                     # PARALLEL PROCESSING with ProcessPoolExecutor
-                    loader = PDFLoader(chunk_size=10)
-                    chunks = list(loader.stream_chunks(input_path))
-                    total_pages = sum(chunk.end_page - chunk.start_page + 1 for chunk in chunks)
+                    # Chunks are submitted as the loader yields them (see below)
+                    # Page ranges of the original PDF, unless an enabled extractor
+                    # reopens the file per page (then small chunk files are cheaper)
+                    loader = PDFLoader(chunk_size=10, split=PipelineController.needs_split_chunks(config))
+                    total_pages = quick_page_count
                     
                     # Progress ready to process
                     yield f"data: {json.dumps({'type': 'progress', 'file': file.filename, 'file_idx': file_idx, 'pages_done': 0, 'total_pages': total_pages, 'percent': 0, 'status': 'Processing...'})}\n\n"
                     await asyncio.sleep(0.01)
                     
-                    results = []
+                    # Markdown is streamed to a partial file as chunks complete (in page
+                    # order) and renamed into place at the end, so the document is never
+                    # held in memory as a whole. Without a local path nothing is saved.
+                    md_path = doc_output_dir / f"{input_path.stem}.md"
+                    part_path = doc_output_dir / f".{input_path.stem}.md.part"
+                    md_file = None
+                    chunks_written = 0
                     pages_done = 0
                     cancelled = False
+                    completed = False  # Set once the partial file is renamed into place
                     
                     # Reset cancel flag at start of processing
                     global _cancel_requested, _active_executor
@@ -848,48 +856,69 @@ async def convert_pdfs_stream(
                     actual_workers = min(workers, cpu_count)
                     
                     # Use limited worker count and store executor globally for cancellation
-                    executor = ProcessPoolExecutor(max_workers=actual_workers)
+                    executor = PipelineController.create_executor(actual_workers, config)
                     _active_executor = executor
                     
                     try:
+                        if use_local_path:
+                            md_file = open(part_path, "w", encoding="utf-8", buffering=1 << 20)
+                        
                         # Debug: Executor lifecycle tracking (guarded to avoid I/O when disabled)
                         from docuforge.debug import debug_log, is_debug_enabled
                         if is_debug_enabled("executor_lifecycle"):
                             temp_dir_debug = Path("C:/Users/Public/DocuForge/Temp")
-                            chunk_status = {c.temp_path.name: c.temp_path.exists() for c in chunks}
                             debug_log("executor_lifecycle", "BEFORE_SUBMIT",
                                 file=file.filename,
                                 temp_dir_contents=[f.name for f in temp_dir_debug.iterdir()],
-                                chunks_exist=chunk_status)
+                                input_exists=input_path.exists())
                         
-                        futures = {
-                            executor.submit(PipelineController.process_chunk, chunk, config, doc_output_dir, validated_watermarks): chunk
-                            for chunk in chunks
-                        }
+                        # Collected in submission (page) order - no sort needed afterwards.
+                        # Not executor.map: one failed chunk must not abort the whole file.
+                        # Each chunk is submitted as soon as it is yielded, so workers start
+                        # on the first pages while the rest are still being produced.
+                        futures = [
+                            (chunk, executor.submit(PipelineController.process_shared_chunk, chunk, doc_output_dir, validated_watermarks))
+                            for chunk in loader.stream_chunks(input_path)
+                        ]
                         
-                        for future in as_completed(futures):
+                        for chunk, future in futures:
                             # Check if cancellation requested
                             if _cancel_requested:
                                 cancelled = True
                                 break
                             
-                            chunk = futures[future]
                             chunk_pages = chunk.end_page - chunk.start_page + 1
                             
                             try:
                                 res = future.result()
-                                results.append((chunk.start_page, res))
                             except Exception as e:
-                                results.append((chunk.start_page, f"\n\n[ERROR: {e}]\n"))
+                                res = f"\n\n[ERROR: {e}]\n"
+                            
+                            if md_file:
+                                if chunks_written:
+                                    md_file.write("\n")
+                                md_file.write(res)
+                                chunks_written += 1
+                            del res
                             
                             pages_done += chunk_pages
                             percent = int((pages_done / total_pages) * 100)
                             
                             yield f"data: {json.dumps({'type': 'progress', 'file': file.filename, 'file_idx': file_idx, 'pages_done': pages_done, 'total_pages': total_pages, 'percent': percent})}\n\n"
                             await asyncio.sleep(0.01)
+                        
+                        if md_file and not cancelled:
+                            md_file.close()
+                            os.replace(part_path, md_path)
+                            completed = True
                     finally:
                         executor.shutdown(wait=True)  # Wait for workers to complete before next PDF
                         _active_executor = None
+                        if md_file:
+                            md_file.close()
+                            # Cancelled or failed: no stale .md.part next to the outputs
+                            if not completed:
+                                part_path.unlink(missing_ok=True)
                         
                         # Debug: Executor lifecycle tracking (guarded to avoid I/O when disabled)
                         from docuforge.debug import debug_log, is_debug_enabled
@@ -904,12 +933,7 @@ async def convert_pdfs_stream(
                     if cancelled:
                         continue
                     
-                    results.sort(key=lambda x: x[0])
-                    final_md = "\n".join([r[1] for r in results])
-                    
                     if use_local_path:
-                        md_path = doc_output_dir / f"{input_path.stem}.md"
-                        md_path.write_text(final_md, encoding="utf-8")
                         yield f"data: {json.dumps({'type': 'file_done', 'file': file.filename, 'file_idx': file_idx, 'status': 'saved', 'path': str(md_path)})}\n\n"
                     else:
                         yield f"data: {json.dumps({'type': 'file_done', 'file': file.filename, 'file_idx': file_idx, 'status': 'processed'})}\n\n"
@@ -7,21 +7,24 @@ from typing import Optional, List
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import traceback
 import warnings
 import logging
 
-from docuforge.src.core.config import AppConfig
-from docuforge.src.ingestion.loader import PDFLoader, PDFChunk
-from docuforge.src.core.controller import PipelineController
+# Pipeline modules (pdfplumber, pikepdf, pydantic, ...) are imported inside
+# convert() so `web`, `--help` and spawned workers re-importing this module
+# don't pay for them.
 from docuforge.src.core.utils import SafeFileManager
 from loguru import logger
 import sys
 import os
+import io
+import time
+import signal
 import tempfile
 import atexit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Suppress PDF parser warnings (pdfminer, PyMuPDF, pdfplumber)
 warnings.filterwarnings('ignore', message='.*FontBBox.*')
@@ -30,72 +33,109 @@ warnings.filterwarnings('ignore', message='.*invalid float.*')
 logging.getLogger('pdfminer').setLevel(logging.ERROR)
 logging.getLogger('fitz').setLevel(logging.ERROR)
 
-# Suppress multiprocessing stderr pollution (OSError from killed workers)
-class _StderrFilter:
-    """Filter stderr to suppress multiprocessing errors from killed workers."""
-    def __init__(self, original):
-        self._original = original
-    def write(self, text):
-        if 'handle is closed' not in text and 'OSError' not in text:
-            self._original.write(text)
-    def flush(self):
-        self._original.flush()
+# Suppress multiprocessing stderr pollution (OSError from killed workers).
+# Those errors surface in the executor's manager thread or as "Exception ignored"
+# from pipe/handle finalizers, so they are dropped at the two hooks instead of
+# filtering every stderr write.
+import threading
 
-sys.stderr = _StderrFilter(sys.stderr)
+_default_thread_excepthook = threading.excepthook
+_default_unraisablehook = sys.unraisablehook
+
+def _quiet_thread_excepthook(args):
+    if issubclass(args.exc_type, OSError) and type(args.thread).__name__ == "_ExecutorManagerThread":
+        return
+    _default_thread_excepthook(args)
+
+def _quiet_unraisablehook(unraisable):
+    if isinstance(unraisable.exc_value, OSError):
+        return
+    _default_unraisablehook(unraisable)
+
+threading.excepthook = _quiet_thread_excepthook
+sys.unraisablehook = _quiet_unraisablehook
 
 # Configure Logger: clean output for user
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
+# Shared console for every command and safety check (terminal probed once)
+console = Console()
+
 # =============================================================================
 # SAFETY GUARDS
 # =============================================================================
 
 LOCK_FILE = Path(tempfile.gettempdir()) / "docuforge.lock"
 
+# Interpreter never changes during a run - decide once at import
+_IN_VENV = sys.prefix != sys.base_prefix
+
+_LOCK_FD = None  # Held open for the whole process lifetime
+
 def _check_single_instance():
-    """Prevent multiple instances from running simultaneously using file lock."""
-    import psutil
+    """
+    Prevent multiple instances from running simultaneously using file lock.
+    The OS releases the lock when the process dies, so a stale lock file
+    (or a reused PID) can never block a new run.
+    """
+    global _LOCK_FD
+    if _LOCK_FD is not None:
+        return
     
-    if LOCK_FILE.exists():
-        try:
-            pid = int(LOCK_FILE.read_text().strip())
-            # Check if process with that PID is still running
-            if psutil.pid_exists(pid):
-                # Double check it's actually a Python/DocuForge process
-                try:
-                    proc = psutil.Process(pid)
-                    if proc.is_running() and 'python' in proc.name().lower():
-                        console = Console()
-                        console.print(Panel.fit(
-                            "[bold red]❌ DocuForge zaten çalışıyor![/bold red]\n\n"
-                            "[dim]Başka bir terminal'de CLI veya Web açık.\n"
-                            "Önce onu kapatın.[/dim]",
-                            border_style="red",
-                            title="Hata"
-                        ))
-                        raise typer.Exit(code=1)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass  # Process died, continue
-        except ValueError:
-            pass  # Lock file corrupt, overwrite it
+    fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        console.print(Panel.fit(
+            "[bold red]❌ DocuForge zaten çalışıyor![/bold red]\n\n"
+            "[dim]Başka bir terminal'de CLI veya Web açık.\n"
+            "Önce onu kapatın.[/dim]",
+            border_style="red",
+            title="Hata"
+        ))
+        raise typer.Exit(code=1)
     
-    # Create/update lock file with current PID
-    LOCK_FILE.write_text(str(os.getpid()))
-    atexit.register(_cleanup_lock)
+    # Record our PID for diagnostics only - the lock itself is what counts
+    try:
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+    except OSError:
+        pass
+    _LOCK_FD = fd
+    atexit.register(_release_instance_lock)
 
-def _cleanup_lock():
-    """Remove lock file on exit."""
+def _release_instance_lock():
+    """Release the single-instance lock explicitly on normal exit."""
+    global _LOCK_FD
+    if _LOCK_FD is None:
+        return
     try:
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
-    except Exception:
+        if os.name == 'nt':
+            import msvcrt
+            os.lseek(_LOCK_FD, 0, os.SEEK_SET)
+            msvcrt.locking(_LOCK_FD, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(_LOCK_FD, fcntl.LOCK_UN)
+        os.close(_LOCK_FD)
+    except OSError:
         pass
+    _LOCK_FD = None
 
 def _cleanup_temp():
-    """Clean DocuForge temp directory on exit."""
+    """
+    Clean DocuForge temp directory on exit.
+    Single non-blocking pass: anything still locked is removed by
+    SafeFileManager.cleanup_global_temp() on the next startup.
+    """
     import shutil
-    import time
     temp_dir = Path("C:/Users/Public/DocuForge/Temp")
     
     def clean():
@@ -114,8 +154,6 @@ def _cleanup_temp():
     
     try:
         clean()
-        time.sleep(2)  # Wait for late file writes
-        clean()
     except:
         pass  # Silently ignore any cleanup errors
 
@@ -123,8 +161,6 @@ atexit.register(_cleanup_temp)
 
 def _check_dependencies():
     """Check if required packages are installed."""
-    console = Console()
-    missing = []
     
     # All essential packages for DocuForge
     critical_packages = [
@@ -148,11 +184,19 @@ def _check_dependencies():
         ("psutil", "psutil"),
     ]
     
-    for import_name, pip_name in critical_packages:
+    # Real imports, so an installed but broken package (ABI mismatch, missing
+    # shared library) is caught here instead of inside a worker. They run on
+    # threads: most of an import is file I/O, which overlaps across packages.
+    def _try_import(package):
+        import_name, pip_name = package
         try:
             __import__(import_name)
-        except ImportError:
-            missing.append(pip_name)
+            return None
+        except Exception:
+            return pip_name
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        missing = [pip_name for pip_name in pool.map(_try_import, critical_packages) if pip_name]
     
     if missing:
         console.print(Panel.fit(
@@ -167,17 +211,18 @@ def _check_dependencies():
 
 def _check_venv():
     """Require virtual environment - blocks execution if not in venv."""
-    console = Console()
-    if sys.prefix == sys.base_prefix:
-        console.print(Panel.fit(
-            "[bold red]❌ Sanal ortam aktif değil![/bold red]\n\n"
-            "[dim]pip listenizin sağlığı için venv zorunludur.[/dim]\n\n"
-            "[yellow]Önce bu komutu çalıştırın:[/yellow]\n"
-            "[cyan].venv\\Scripts\\Activate.ps1[/cyan]",
-            border_style="red",
-            title="Hata"
-        ))
-        raise typer.Exit(code=1)
+    if _IN_VENV:
+        return
+    
+    console.print(Panel.fit(
+        "[bold red]❌ Sanal ortam aktif değil![/bold red]\n\n"
+        "[dim]pip listenizin sağlığı için venv zorunludur.[/dim]\n\n"
+        "[yellow]Önce bu komutu çalıştırın:[/yellow]\n"
+        "[cyan].venv\\Scripts\\Activate.ps1[/cyan]",
+        border_style="red",
+        title="Hata"
+    ))
+    raise typer.Exit(code=1)
 
 def _safety_callback():
     """Combined safety checks callback."""
@@ -193,14 +238,49 @@ app = typer.Typer(
     add_completion=False,  # Hide install-completion and show-completion from --help
     callback=_safety_callback   # Run all safety checks before any command
 )
-console = Console()
+
+def _clear_screen():
+    """Clear the terminal with ANSI escapes (no cls/clear subprocess)."""
+    console.clear()
+
+def _find_pdfs(root: Path, recursive: bool) -> List[Path]:
+    """
+    PDF files in root (and its subdirectories if recursive).
+    Walks with os.scandir, so a Path is built only for the matches. Names are
+    compared with the platform's case rules (like glob: any case on Windows).
+    """
+    pdfs = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_file():
+                        if os.path.normcase(entry.name).endswith(".pdf"):
+                            pdfs.append(Path(entry.path))
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue  # Unreadable directory
+    return pdfs
+
+def _default_workers() -> int:
+    """
+    Worker count when --workers is not given: ~75% of the cores this process
+    may run on (same policy as the interactive wizard).
+    """
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on Windows/macOS
+        cpu_count = os.cpu_count() or 4
+    return max(1, int(cpu_count * 0.75))
 
 @app.command()
 def convert(
     input_dir: Optional[Path] = typer.Option(None, "--input", "-i", help="Directory containing PDFs"),
     output_dir: Optional[Path] = typer.Option(None, "--output", "-o", help="Directory for output Markdown"),
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to config.yaml"),
-    workers: int = typer.Option(4, "--workers", "-w", help="Number of parallel workers"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Number of parallel workers (default: ~75% of available cores)"),
     charts: bool = typer.Option(False, "--charts", help="Enable chart extraction (Experimental/Irregular support)"),
     recursive: bool = typer.Option(False, "--recursive", "-r", help="Analyze subdirectories recursively"),
 ):
@@ -209,7 +289,13 @@ def convert(
     Runs in Interactive Wizard mode if no arguments are provided.
     """
     # Clear terminal for clean UI
-    os.system('cls' if os.name == 'nt' else 'clear')
+    _clear_screen()
+    
+    from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
+    from docuforge.src.core.config import AppConfig
+    from docuforge.src.ingestion.loader import PDFLoader
+    from docuforge.src.core.controller import PipelineController
+    from docuforge.src.cleaning.watermark_analyzer import WatermarkAnalyzer
     
     # 1. Load Base Config
     if config_path:
@@ -228,14 +314,15 @@ def convert(
             output_dir = config.output_dir
             workers = config.workers
         except KeyboardInterrupt:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            _clear_screen()
             console.print("[dim]CLI stopped.[/dim]")
             raise typer.Exit()
     else:
         # Override config with CLI args
         config.input_dir = input_dir
         config.output_dir = output_dir or input_dir
-        config.workers = workers
+        config.workers = workers or _default_workers()
+        workers = config.workers
         config.extraction.charts_enabled = charts
         config.extraction.recursive = recursive
 
@@ -258,15 +345,9 @@ def convert(
     console.print(f"Output: {output_dir}")
     console.print(f"Workers: {workers}")
 
-    # Initialize Loader
-    loader = PDFLoader(chunk_size=10)  # 10 pages per chunk for smooth progress
-    
     # 5. Recursive Scanning
-    if config.extraction.recursive:
-        pdfs = list(input_dir.rglob("*.pdf"))
-    else:
-        pdfs = list(input_dir.glob("*.pdf"))
-        
+    pdfs = _find_pdfs(input_dir, config.extraction.recursive)
+    
     if not pdfs:
         console.print("[yellow]No PDFs found in input directory.[/yellow]")
         return
@@ -275,132 +356,303 @@ def convert(
     console.print(f"Total Files to Process: [bold cyan]{total_pdfs}[/bold cyan]")
     
     # Suppress loguru console output to keep TUI clean
-    from loguru import logger
     logger.remove()
     logger.add(lambda msg: None, level="INFO") # Swallow INFO logs
     
     # Timing tracking
-    import time
     batch_start_time = time.time()
     file_times = []  # Store each file's processing time
     
     # Custom Progress Columns with Elapsed Time
-    from rich.progress import TimeElapsedColumn
     try:
+        # No spinner + low refresh rate: the renderer must not compete with draining futures
         with Progress(
-            SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
             console=console,
+            refresh_per_second=4,
+            auto_refresh=True,
             transient=True  # Clear bars after completion
         ) as progress:
             
-            main_task = progress.add_task(f"[green]Total Batch [1/{total_pdfs}]", total=total_pdfs)
-            # Show file_task immediately with first file name
-            first_file_name = pdfs[0].name if pdfs else "Preparing..."
-            file_task = progress.add_task(f"[cyan]Preparing: {first_file_name}", total=100, visible=True)
-        
-            for idx, pdf_path in enumerate(pdfs, 1):
-                file_start_time = time.time()
-                progress.update(main_task, description=f"[green]Total Batch [{idx}/{total_pdfs}]")
+            main_task = progress.add_task(f"[green]Total Batch [0/{total_pdfs}]", total=total_pdfs)
+            
+            # One worker pool serves the whole batch: workers are spawned and
+            # warmed up once instead of once per PDF.
+            _cli_executor = None
+            _cli_file_pool = None
+            # Set on Ctrl+C: file threads still running stop before their
+            # next watermark scan / submission instead of finishing the batch
+            stop_event = threading.Event()
+            
+            def _sigint_handler(signum, frame):
+                """Handle Ctrl+C by killing workers immediately."""
+                nonlocal _cli_executor
+                
+                # Suppress stderr to prevent terminal pollution
+                sys.stderr = io.StringIO()
                 
-                # Smart Output Path
+                stop_event.set()
+                if _cli_file_pool:
+                    # Drop queued files: leaving the pool's with-block joins them
+                    _cli_file_pool.shutdown(wait=False, cancel_futures=True)
+                if _cli_executor:
+                    PipelineController.kill_workers(_cli_executor)
+                    _cli_executor.shutdown(wait=False, cancel_futures=True)
+                raise KeyboardInterrupt()
+            
+            old_handler = signal.signal(signal.SIGINT, _sigint_handler)
+            
+            # Smart Output Path - resolved up front so each distinct directory
+            # is created once instead of once per PDF.
+            target_dirs = {}
+            for pdf_path in pdfs:
+                target_dir = output_dir
                 if config.extraction.recursive:
                     try:
-                        rel_path = pdf_path.relative_to(input_dir).parent
-                        target_dir = output_dir / rel_path
+                        target_dir = output_dir / pdf_path.relative_to(input_dir).parent
                     except ValueError:
-                        target_dir = output_dir
-                else:
-                    target_dir = output_dir
-                    
+                        pass
+                target_dirs[pdf_path] = target_dir
+            for target_dir in set(target_dirs.values()) - {output_dir}:
                 target_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Never spawn more workers than there are chunks to process
+            # (a batch of small PDFs may have fewer pages than workers; a chunk
+            # is at least one page). Counting stops once the pool is known to fill.
+            pool_size = 0
+            for pdf_path in pdfs:
+                pool_size += PDFLoader.count_pages(pdf_path)
+                if pool_size >= workers:
+                    break
+            pool_size = max(1, min(workers, pool_size))
+            
+            # Several files are driven at once by threads: while one file waits on
+            # its chunks, another runs its watermark scan, page count or disk write.
+            # All CPU-heavy chunk work still goes through the single process pool.
+            file_threads = max(1, min(4, total_pdfs))
+            stats_lock = threading.Lock()
+            files_done = 0
+            chunk_errors = []  # (pdf_path, first page of failed task, error)
+            
+            # Watermark pre-scan of the next file to start runs in the background
+            # while the current files are processing (prefetch depth 1).
+            prefetch_pool = ThreadPoolExecutor(max_workers=1)
+            prefetched = {}   # pdf index -> Future[validated watermarks]
+            started = set()   # pdf indexes already picked up by a file thread
+            
+            def _analyze(pdf_path: Path):
+                return WatermarkAnalyzer(pdf_path).analyze()
+            
+            def _prefetch(idx: int):
+                if idx >= total_pdfs:
+                    return
+                with stats_lock:
+                    if idx in started or idx in prefetched:
+                        return
+                    prefetched[idx] = prefetch_pool.submit(_analyze, pdfs[idx])
+            
+            def _take_watermarks(idx: int):
+                with stats_lock:
+                    started.add(idx)
+                    future = prefetched.pop(idx, None)
+                return future.result() if future else _analyze(pdfs[idx])
+            
+            # The shared pool is replaced if a worker dies (OOM, crash in a native
+            # library): the pool is then broken for every file, and without a
+            # fresh one the rest of the batch could not be processed.
+            executor = None
+            pool_lock = threading.Lock()
+            
+            def _replace_pool(broken):
+                """Current pool, replacing it first if it is still the broken one."""
+                nonlocal executor, _cli_executor
+                with pool_lock:
+                    if executor is broken and not stop_event.is_set():
+                        broken.shutdown(wait=False, cancel_futures=True)
+                        executor = PipelineController.create_executor(pool_size, config)
+                        _cli_executor = executor
+                    return executor
+            
+            def _submit_task(batch, doc_context_dir, validated_watermarks):
+                """Submit one task; returns (future, pool it was submitted to)."""
+                pool = executor
+                try:
+                    return pool.submit(PipelineController.process_shared_chunks, batch, doc_context_dir, validated_watermarks), pool
+                except (BrokenProcessPool, RuntimeError):
+                    if stop_event.is_set():
+                        raise
+                    pool = _replace_pool(pool)
+                    return pool.submit(PipelineController.process_shared_chunks, batch, doc_context_dir, validated_watermarks), pool
+            
+            def _run_pdf(idx: int, pdf_path: Path):
+                """Convert one PDF through the shared pool and write its Markdown."""
+                nonlocal files_done
+                if stop_event.is_set():
+                    return
+                file_start_time = time.time()
+                
+                target_dir = target_dirs[pdf_path]
                 doc_context_dir = target_dir / pdf_path.stem
                 
+                # Total is indeterminate until the loader has yielded every chunk
+                file_task = progress.add_task(f"[cyan]Preparing: {pdf_path.name}", total=None)
+                
                 # Watermark Analysis - Pre-scan to find true watermarks (>60% of pages)
-                from docuforge.src.cleaning.watermark_analyzer import WatermarkAnalyzer
-                analyzer = WatermarkAnalyzer(pdf_path)
-                validated_watermarks = analyzer.analyze()
+                validated_watermarks = _take_watermarks(idx)
+                if stop_event.is_set():
+                    progress.remove_task(file_task)
+                    return
                 
-                # Prepare chunks
-                # Reset file task timer for new file
-                progress.reset(file_task)
-                progress.update(file_task, description=f"[cyan]Reading: {pdf_path.name}", visible=True, total=None)  # Indeterminate while reading
-                chunks = list(loader.stream_chunks(pdf_path))
-                total_chunks = len(chunks)
+                progress.update(file_task, description=f"[cyan]Processing: {pdf_path.name}")
                 
-                progress.reset(file_task)  # Reset again after reading
-                progress.update(file_task, description=f"[cyan]Processing: {pdf_path.name}", total=total_chunks, completed=0)
+                # Parallel Execution (shared pool)
+                # Markdown is streamed to disk as results arrive (in page order),
+                # so at most the in-flight chunks are held in memory.
+                # Opened on the first result: a file with no output gets no .md.
+                # Written to a partial file and renamed into place once every
+                # task is drained, so an interrupted run never leaves a truncated
+                # .md over the output of an earlier run.
+                md_path = target_dir / f"{pdf_path.stem}.md"
+                part_path = target_dir / f".{pdf_path.stem}.md.part"
+                md_file = None
+                completed = False
                 
-                doc_full_md = []
+                # Bounded pipeline: the loader prepares chunk N+1 while workers
+                # process chunk N. Draining the oldest future first keeps page order.
+                in_flight = deque()
+                max_in_flight = 2 * pool_size
                 
-                # Global executor for signal handling
-                import signal
-                _cli_executor = None
+                # Chunk size follows the page count (~2 chunks per worker). Workers
+                # read page ranges of the original PDF unless an enabled extractor
+                # reopens the file per page, which needs small chunk files.
+                page_count = PDFLoader.count_pages(pdf_path)
+                loader = PDFLoader(
+                    chunk_size=PDFLoader.balanced_chunk_size(page_count, pool_size),
+                    split=PipelineController.needs_split_chunks(config),
+                )
                 
-                def _sigint_handler(signum, frame):
-                    """Handle Ctrl+C by killing workers immediately."""
-                    nonlocal _cli_executor
-                    
-                    # Suppress stderr to prevent terminal pollution
-                    import io
-                    sys.stderr = io.StringIO()
-                    
-                    if _cli_executor:
-                        try:
-                            import psutil
-                            current = psutil.Process(os.getpid())
-                            for child in current.children(recursive=True):
-                                try:
-                                    child.kill()
-                                except:
-                                    pass
-                        except:
-                            pass
-                        _cli_executor.shutdown(wait=False, cancel_futures=True)
-                    raise KeyboardInterrupt()
+                # Large PDFs: several consecutive chunks per task (one IPC round-trip
+                # each), while still leaving ~4 tasks per worker for load balancing.
+                chunks_per_task = max(1, -(-page_count // loader.chunk_size) // (pool_size * 4))
                 
-                old_handler = signal.signal(signal.SIGINT, _sigint_handler)
+                def _write_part(part: str):
+                    nonlocal md_file
+                    if md_file is None:
+                        md_file = open(part_path, "w", encoding="utf-8", buffering=1 << 20)
+                    else:
+                        md_file.write("\n")
+                    md_file.write(part)
+                
+                def _record_error(start_page: int, e: BaseException):
+                    # Recorded for the end-of-batch summary; no I/O here
+                    with stats_lock:
+                        chunk_errors.append((pdf_path, start_page, f"{type(e).__name__}: {e}"))
+                
+                def _drain_oldest():
+                    future, batch, pool = in_flight.popleft()
+                    try:
+                        parts = future.result()
+                    except BrokenProcessPool as e:
+                        # A worker died, maybe while running another file's task:
+                        # retry this task once on a fresh pool
+                        error = e
+                        parts = None
+                        if not stop_event.is_set():
+                            _replace_pool(pool)
+                            try:
+                                parts = _submit_task(batch, doc_context_dir, validated_watermarks)[0].result()
+                            except Exception as retry_error:
+                                error = retry_error
+                        if parts is None:
+                            _record_error(batch[0].start_page, error)
+                            parts = []
+                    except Exception as e:
+                        _record_error(batch[0].start_page, e)
+                        parts = []
+                    for part in parts:
+                        _write_part(part)
+                
+                def _submit(batch):
+                    future, pool = _submit_task(batch, doc_context_dir, validated_watermarks)
+                    # Progress moves when a task finishes, not when the in-order
+                    # drain reaches it (callback runs in the executor's thread)
+                    n_chunks = len(batch)
+                    def _on_done(_f):
+                        try:
+                            progress.update(file_task, advance=n_chunks)
+                        except KeyError:
+                            pass  # File task already removed
+                    future.add_done_callback(_on_done)
+                    in_flight.append((future, batch, pool))
+                    if len(in_flight) >= max_in_flight:
+                        _drain_oldest()
                 
-                # Parallel Execution
+                total_chunks = 0
+                batch = []
                 try:
-                    with ProcessPoolExecutor(max_workers=workers) as executor:
-                        _cli_executor = executor
-                        futures = {
-                            executor.submit(PipelineController.process_chunk, chunk, config, doc_context_dir, validated_watermarks): chunk.start_page 
-                            for chunk in chunks
-                        }
+                    for chunk in loader.stream_chunks(pdf_path):
+                        if stop_event.is_set():
+                            return
+                        batch.append(chunk)
+                        total_chunks += 1
+                        if len(batch) >= chunks_per_task:
+                            _submit(batch)
+                            batch = []
+                    if batch:
+                        _submit(batch)
                     
-                        results = []
-                        for future in as_completed(futures):
-                            start_page = futures[future]
-                            try:
-                                res = future.result()
-                                results.append((start_page, res))
-                            except Exception as e:
-                                # Log error but don't break UI
-                                pass 
-                            
-                            progress.advance(file_task)
+                    # Everything for this file is queued: scan the file that will
+                    # start when this one finishes
+                    _prefetch(idx + file_threads)
+                    
+                    progress.update(file_task, total=total_chunks)
+                    while in_flight:
+                        _drain_oldest()
+                    completed = True
+                except (BrokenProcessPool, RuntimeError) as e:
+                    if stop_event.is_set():
+                        raise
+                    # Even a fresh pool could not take this file's tasks: mark the
+                    # file as failed and let the other files carry on
+                    _record_error(batch[0].start_page if batch else 1, e)
+                    progress.remove_task(file_task)
+                    return
                 finally:
-                    signal.signal(signal.SIGINT, old_handler)
-                    _cli_executor = None
+                    if md_file is not None:
+                        md_file.close()
+                        if completed:
+                            os.replace(part_path, md_path)
+                        else:
+                            part_path.unlink(missing_ok=True)
                 
-                # Sort results
-                results.sort(key=lambda x: x[0])
-                doc_full_md = [r[1] for r in results]
-                
-                if doc_full_md:
-                    final_md = "\n".join(doc_full_md)
-                    (target_dir / f"{pdf_path.stem}.md").write_text(final_md, encoding="utf-8")
+                progress.remove_task(file_task)
                 
                 # Track file time
-                file_time = time.time() - file_start_time
-                file_times.append(file_time)
-                
-                progress.advance(main_task)
+                with stats_lock:
+                    file_times.append(time.time() - file_start_time)
+                    files_done += 1
+                    progress.update(main_task, advance=1, description=f"[green]Total Batch [{files_done}/{total_pdfs}]")
+            
+            try:
+                executor = PipelineController.create_executor(pool_size, config)
+                _cli_executor = executor
+                try:
+                    with ThreadPoolExecutor(max_workers=file_threads) as file_pool:
+                        _cli_file_pool = file_pool
+                        file_futures = [file_pool.submit(_run_pdf, idx, pdf_path) for idx, pdf_path in enumerate(pdfs)]
+                        # Re-raise the first failure the same way the sequential loop did
+                        for file_future in file_futures:
+                            file_future.result()
+                finally:
+                    executor.shutdown(wait=True)
+            finally:
+                signal.signal(signal.SIGINT, old_handler)
+                _cli_executor = None
+                _cli_file_pool = None
+                prefetch_pool.shutdown(wait=False, cancel_futures=True)
         
         # Final Summary
         total_time = time.time() - batch_start_time
@@ -409,9 +661,19 @@ def convert(
         console.print(f"\n[bold green]✓ Batch Completed![/bold green]")
         console.print(f"  Files: [cyan]{len(file_times)}/{total_pdfs}[/cyan] | Avg: [cyan]{avg_time:.1f}s/file[/cyan] | Total: [cyan]{total_time:.1f}s[/cyan]")
         console.print(f"  Output: [dim]{output_dir}[/dim]")
+        
+        if chunk_errors:
+            from rich.table import Table
+            table = Table(title=f"[yellow]⚠ {len(chunk_errors)} chunk(s) failed - their pages are missing from the output[/yellow]", title_justify="left")
+            table.add_column("File", style="cyan")
+            table.add_column("From page", justify="right")
+            table.add_column("Error", style="dim")
+            for failed_pdf, start_page, error in sorted(chunk_errors, key=lambda e: (str(e[0]), e[1])):
+                table.add_row(failed_pdf.name, str(start_page), error[:120])
+            console.print(table)
         console.print(f"  [cyan]ℹ Output may contain errors. Verification recommended.[/cyan]")
     except KeyboardInterrupt:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
         console.print("[dim]CLI stopped.[/dim]")
         raise typer.Exit()
 
@@ -420,10 +682,8 @@ def web():
     """
     Launch the Web Interface & API Server (Localhost).
     """
-    import os
-    
     # Clear terminal before starting
-    os.system('cls' if os.name == 'nt' else 'clear')
+    _clear_screen()
     
     console.print(Panel.fit(
         "[bold cyan]DocuForge Web Server[/bold cyan]\n"
@@ -442,7 +702,7 @@ def web():
         pass
     finally:
         # Clear terminal when server stops
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
         console.print("[dim]Web server stopped.[/dim]")
 
 if __name__ == "__main__":
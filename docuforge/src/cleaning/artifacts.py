@@ -1,7 +1,11 @@
 import re
-from typing import List, Set, Optional
+from typing import Dict, FrozenSet, List, Set, Optional, Tuple
 from docuforge.src.core.config import CleaningConfig
 
+# Compiled patterns shared by every TextCleaner in the process (one is built
+# per chunk), so each worker compiles a given watermark set once.
+_WATERMARK_CACHE: Dict[FrozenSet[str], Tuple[List[re.Pattern], re.Pattern]] = {}
+
 
 class TextCleaner:
     def __init__(self, config: CleaningConfig, validated_watermarks: Optional[Set[str]] = None):
@@ -17,10 +21,24 @@ class TextCleaner:
         self.config = config
         
         # Only use validated watermarks (patterns confirmed to appear on >60% of pages)
+        # (one pattern per watermark, applied in order, plus their union that
+        # finds the few lines containing any watermark in a single search)
         if validated_watermarks:
-            self.user_patterns = [re.compile(re.escape(p), re.IGNORECASE) for p in validated_watermarks]
+            key = frozenset(validated_watermarks)
+            if key not in _WATERMARK_CACHE:
+                _WATERMARK_CACHE[key] = (
+                    [re.compile(re.escape(p), re.IGNORECASE) for p in key],
+                    re.compile("|".join(map(re.escape, key)), re.IGNORECASE),
+                )
+            self.user_patterns, self._watermark_any_re = _WATERMARK_CACHE[key]
         else:
             self.user_patterns = []
+            self._watermark_any_re = None
+
+    # PDF font encoding issue where bullets become # or 9: a single # or 9 at
+    # line start, then a space, then the first letter of the text. The
+    # letter is checked for upper case (any script) in _bullet_repl.
+    _BULLET_FIX_RE = re.compile(r"^([^\S\n]*)[#9](?= [^\S\n]*(\w))", re.MULTILINE)
 
     def clean_text(self, text: str) -> str:
         """
@@ -30,71 +48,66 @@ class TextCleaner:
         if not text:
             return ""
         
-        # Apply user tag removal (smart)
-        for pattern in self.user_patterns:
-            text = self._smart_remove_pattern(text, pattern)
+        # Apply user tag removal (smart) - all patterns in one pass over the lines
+        if self.user_patterns:
+            text = self._smart_remove_patterns(text, self.user_patterns, self._watermark_any_re)
             
-        lines = text.split('\n')
-        cleaned_lines = []
+        # Fix bullet point encoding issues in one pass over the buffer
+        text = self._BULLET_FIX_RE.sub(self._bullet_repl, text)
         
-        for line in lines:
-            
-            # Fix bullet point encoding issues
-            line = self._fix_bullet_encoding(line)
-            
-            # Skip empty lines that result from removal
-            if line.strip():
-                cleaned_lines.append(line)
-            
-        result = "\n".join(cleaned_lines)
+        # Skip empty lines that result from removal
+        result = "\n".join([line for line in text.split('\n') if line.strip()])
         
-        # Remove trailing standalone page numbers (common in footers)
-        result = re.sub(r'(?:^|\n)\s*\d+\s*$', '', result)
+        # Remove trailing standalone page number (common in footers).
+        # Only the last line can be one, so check it instead of scanning the text.
+        head, _, last = result.rpartition('\n')
+        if last.strip().isdecimal():
+            result = head
         
         return result
     
-    def _smart_remove_pattern(self, text: str, pattern: re.Pattern) -> str:
+    def _smart_remove_patterns(self, text: str, patterns: List[re.Pattern], any_pattern: re.Pattern) -> str:
         """
-        Smart pattern removal:
+        Smart pattern removal, applying every pattern in order to each line:
         - If pattern is the entire line content (>80%), remove the line
         - Otherwise, just remove the matched text
+        Lines that any_pattern (the union of all patterns) doesn't match are
+        kept as they are without trying each pattern.
         """
+        if not any_pattern.search(text):
+            return text
+        
         lines = text.split('\n')
         result_lines = []
         
         for line in lines:
-            match = pattern.search(line)
-            if match:
+            if not any_pattern.search(line):
+                result_lines.append(line)
+                continue
+            for pattern in patterns:
+                match = pattern.search(line)
+                if not match:
+                    continue
                 matched_text = match.group()
                 line_content = line.strip()
                 
                 # If matched text is >80% of line, remove entire line
                 if len(line_content) > 0 and len(matched_text) / len(line_content) > 0.8:
-                    continue  # Skip this line entirely
-                else:
-                    # Just remove the matched text
-                    line = pattern.sub('', line)
-                    # Clean up extra spaces
-                    line = re.sub(r'\s{2,}', ' ', line)
+                    line = None
+                    break
+                # Just remove the matched text
+                line = pattern.sub('', line)
+                # Clean up extra spaces
+                line = re.sub(r'\s{2,}', ' ', line)
             
-            result_lines.append(line)
+            if line is not None:
+                result_lines.append(line)
         
         return '\n'.join(result_lines)
     
-    def _fix_bullet_encoding(self, line: str) -> str:
-        """
-        Fix PDF font encoding issues where bullets become # or 9.
-        Only affects single chars at line start followed by space and text.
-        """
-        stripped = line.lstrip()
-        if not stripped:
-            return line
-        
-        # Pattern: line starts with # or 9, then space, then actual content
-        if len(stripped) > 2 and stripped[0] in '#9' and stripped[1] == ' ':
-            rest = stripped[2:].lstrip()
-            if rest and (rest[0].isupper() or rest[0] in 'İĞÜÇÖŞ'):
-                leading_space = line[:len(line) - len(stripped)]
-                return leading_space + '-' + stripped[1:]
-        
-        return line
+    @staticmethod
+    def _bullet_repl(match: re.Match) -> str:
+        """Turn a misencoded bullet into '-' when the text after it starts upper case."""
+        if match.group(2).isupper():
+            return match.group(1) + '-'
+        return match.group(0)
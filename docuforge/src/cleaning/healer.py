@@ -1,12 +1,25 @@
 # Copyright (c) 2025 GÖKSEL ÖZKAN
+import functools
+import hashlib
+import os
 import re
-import warnings
-# Suppress pkg_resources deprecation warning
-warnings.filterwarnings("ignore", category=UserWarning, module='pkg_resources')
-import pkg_resources
+import sys
 from pathlib import Path
 from typing import Literal, Set
-from symspellpy import SymSpell, Verbosity
+from loguru import logger
+from symspellpy import SymSpell
+
+# Stop words used by TextHealer.detect_language
+STOPS_TR = frozenset({'ve', 'bir', 'bu', 'için', 'ile', 'de', 'da', 'ki', 'ne', 'gibi'})
+STOPS_EN = frozenset({'the', 'and', 'of', 'to', 'in', 'is', 'it', 'you', 'that', 'for'})
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory (the installed package may be read-only)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "docuforge"
 
 class TextHealer:
     """
@@ -33,9 +46,15 @@ class TextHealer:
         
         self.loaded_langs = set()
         self._load_dictionaries()
+        # An edit-distance-0 lookup is plain membership in SymSpell's word
+        # dict; test it directly instead of going through lookup().
+        self.vocab = self.sym_spell.words
         
         self._initialized = True
         
+        # Per-line memo of step 3 in heal_document (see there)
+        self._merge_line = functools.lru_cache(maxsize=4096)(self._merge_tokens)
+        
         # 1. Hyphen Repair
         self.re_hyphen = re.compile(r'([a-zçğıöşü]{3,})\s?-\s?([a-zçğıöşü]{3,})')
         
@@ -68,19 +87,80 @@ class TextHealer:
         # "v e y a" -> "veya", "ya da" (separate).
         # "bir çok" -> "birçok" (Common error)
         # "hiç bir" -> "hiçbir"
-        self.re_hard_fixes = [
-            (re.compile(r'\bv\s+e\s+y\s+a\b', re.IGNORECASE), "veya"),
-            (re.compile(r'\bb\s+i\s+r\s+ç\s+o\s+k\b', re.IGNORECASE), "birçok"),
-            (re.compile(r'\bh\s+i\s+ç\s+b\s+i\s+r\b', re.IGNORECASE), "hiçbir"),
-            (re.compile(r'\bb\s+i\s+r\s+a\s+z\b', re.IGNORECASE), "biraz"),
-            (re.compile(r'\bh\s+e\s+r\s+h\s+a\s+n\s+g\s+i\b', re.IGNORECASE), "herhangi"),
+        hard_fixes = [
+            (r'\bv\s+e\s+y\s+a\b', "veya"),
+            (r'\bb\s+i\s+r\s+ç\s+o\s+k\b', "birçok"),
+            (r'\bh\s+i\s+ç\s+b\s+i\s+r\b', "hiçbir"),
+            (r'\bb\s+i\s+r\s+a\s+z\b', "biraz"),
+            (r'\bh\s+e\s+r\s+h\s+a\s+n\s+g\s+i\b', "herhangi"),
         ]
+        # One union regex (one scan of the text); the named group that matched
+        # selects the replacement.
+        self.hard_fix_map = {f"f{i}": replacement for i, (_, replacement) in enumerate(hard_fixes)}
+        self.re_hard_fixes = re.compile(
+            "|".join(f"(?P<f{i}>{pattern})" for i, (pattern, _) in enumerate(hard_fixes)),
+            re.IGNORECASE
+        )
         
         # Single char glue: "k e l i m e". 
         # Captures sequence of 3+ single chars spaced out.
         self.re_explosion_strict = re.compile(r'\b(?:[a-zA-ZçğıöşüÇĞİÖŞÜ]\s+){2,}[a-zA-ZçğıöşüÇĞİÖŞÜ]\b')
+        
+        # Token-merge helpers (run per token, so compiled once here)
+        self.re_ws_split = re.compile(r'(\s+)')
+        self.re_has_letter = re.compile(r'[a-zA-ZçğıöşüÇĞİÖŞÜ]')
+        self.re_inline_space = re.compile(r'^[ \t]+$')
+        self.re_word = re.compile(r'^[a-zA-ZçğıöşüÇĞİÖŞÜ]+$')
 
     def _load_dictionaries(self):
+        sources = self._dictionary_sources()
+        if not sources:
+            return
+        
+        # Building SymSpell's delete index is the slow part of startup, so the
+        # built index is pickled once and reloaded by later processes/runs.
+        # The file name encodes the sources' identity and the SymSpell settings.
+        fingerprint = hashlib.blake2b(digest_size=8)
+        fingerprint.update(repr((self.sym_spell._max_dictionary_edit_distance, self.sym_spell._prefix_length)).encode())
+        for lang, path in sources:
+            st = path.stat()
+            fingerprint.update(f"{lang}|{path}|{st.st_mtime_ns}|{st.st_size}".encode())
+        index_path = _user_cache_dir() / f"symspell_{fingerprint.hexdigest()}.pickle"
+        
+        try:
+            if index_path.exists() and self.sym_spell.load_pickle(str(index_path)):
+                self.loaded_langs.update(lang for lang, _ in sources)
+                return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable SymSpell index {index_path}: {e}")
+        
+        for lang, path in sources:
+            try:
+                self.sym_spell.load_dictionary(str(path), term_index=0, count_index=1)
+                self.loaded_langs.add(lang)
+            except Exception as e:
+                print(f"Error loading {lang} dict: {e}")
+        
+        if len(self.loaded_langs) < len(sources):
+            return  # Don't persist an incomplete index
+        
+        # Write-then-rename: workers starting together may all build the index
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in index_path.parent.glob("symspell_*.pickle"):
+                if stale != index_path:
+                    stale.unlink(missing_ok=True)
+            self.sym_spell.save_pickle(str(tmp_path))
+            os.replace(tmp_path, index_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Could not save SymSpell index to {index_path.parent}: {e}")
+
+    def _dictionary_sources(self):
+        """(lang, path) of the frequency dictionaries to load (downloads Turkish if missing)."""
+        sources = []
+        
         # A. Load English (SymSpell default)
         try:
             # Try raw path relative to package first (Safer than pkg_resources)
@@ -89,8 +169,7 @@ class TextHealer:
             dictionary_path = base_path / "frequency_dictionary_en_82_765.txt"
             
             if dictionary_path.exists():
-                self.sym_spell.load_dictionary(str(dictionary_path), term_index=0, count_index=1)
-                self.loaded_langs.add('en')
+                sources.append(('en', dictionary_path))
             else:
                 print(f"Warning: English dictionary not found at {dictionary_path}")
         except Exception as e:
@@ -126,18 +205,23 @@ class TextHealer:
         
         if tr_path.exists():
             # Format is now "word count" properly
-            self.sym_spell.load_dictionary(str(tr_path), term_index=0, count_index=1)
-            self.loaded_langs.add('tr')
+            sources.append(('tr', tr_path))
+        
+        return sources
 
     def detect_language(self, text: str) -> Literal['tr', 'en']:
         """Simple stop-word detection"""
-        stops_tr = {'ve', 'bir', 'bu', 'için', 'ile', 'de', 'da', 'ki', 'ne', 'gibi'}
-        stops_en = {'the', 'and', 'of', 'to', 'in', 'is', 'it', 'you', 'that', 'for'}
-        words = set(text.lower().split())
-        score_tr = len(words.intersection(stops_tr))
-        score_en = len(words.intersection(stops_en))
+        # Only the (distinct) stop words hit are collected, not a set of all words
+        words = text.lower().split()
+        score_tr = len(STOPS_TR.intersection(words))
+        score_en = len(STOPS_EN.intersection(words))
         return 'en' if score_en > score_tr else 'tr'
 
+    # Vowel class markers for check_vowel_harmony: str.translate maps every
+    # vowel to its class in one C-level pass (other characters are kept).
+    _BACK, _FRONT = '\x01', '\x02'
+    _VOWEL_CLASS = str.maketrans({**{c: '\x01' for c in "aıouAIOU"}, **{c: '\x02' for c in "eiöüEİÖÜ"}})
+
     def check_vowel_harmony(self, base_word: str, suffix: str) -> bool:
         """
         Simple Major Vowel Harmony Check.
@@ -145,35 +229,19 @@ class TextHealer:
         Front Vowels (e, i, ö, ü) -> suffix needs (e, i, ö, ü) - usually 'e' or 'ü'
         """
         # Last vowel of base_word
-        vowels_back = set("aıouAIOU")
-        vowels_front = set("eiöüEİÖÜ")
-        
-        last_vowel_type = None # 'back' or 'front'
-        for char in reversed(base_word):
-            if char in vowels_back:
-                last_vowel_type = 'back'
-                break
-            elif char in vowels_front:
-                last_vowel_type = 'front'
-                break
-        
-        if not last_vowel_type:
+        base = base_word.translate(self._VOWEL_CLASS)
+        last = max(base.rfind(self._BACK), base.rfind(self._FRONT))
+        if last < 0:
             return True # No vowels found? Default to permissive.
-            
-        # First vowel of suffix
-        suffix_vowel_type = None
-        for char in suffix:
-            if char in vowels_back:
-                suffix_vowel_type = 'back'
-                break
-            elif char in vowels_front:
-                suffix_vowel_type = 'front'
-                break
         
-        if not suffix_vowel_type:
+        # First vowel of suffix
+        suf = suffix.translate(self._VOWEL_CLASS)
+        first_back, first_front = suf.find(self._BACK), suf.find(self._FRONT)
+        if first_back < 0 and first_front < 0:
             return True # Suffix has no vowels (e.g. 'm'?)
-            
-        return last_vowel_type == suffix_vowel_type
+        suffix_class = self._BACK if first_front < 0 or 0 <= first_back < first_front else self._FRONT
+        
+        return base[last] == suffix_class
 
     def heal_document(self, text: str) -> str:
         if not text: return ""
@@ -183,8 +251,7 @@ class TextHealer:
         # orphaned suffixes
         if lang == 'tr':
             # Hard Fixes First (Common patterns)
-            for pattern, replacement in self.re_hard_fixes:
-                text = pattern.sub(replacement, text)
+            text = self.re_hard_fixes.sub(lambda m: self.hard_fix_map[m.lastgroup], text)
             
             # Suffixes with Vowel Harmony Check
             def suffix_repl(m):
@@ -206,18 +273,31 @@ class TextHealer:
             # Hybrid: If strict explosion regex matched, trust it more? 
             # Or just rely on dictionary. Dictionary is safer.
             if len(merged) > 2:
-                 if self.sym_spell.lookup(merged, Verbosity.TOP, max_edit_distance=0):
+                 if merged in self.vocab:
                      return merged
             return s
             
         text = self.re_explosion_strict.sub(explosion_repl, text)
         
         # 3. Token-Based Smart Merge (Iterative Sliding Window)
+        # Merges only join words separated by spaces/tabs, so each line can be
+        # healed on its own. Lines repeat a lot (headers, footers, table cells),
+        # so every distinct line is merged once and the result memoized.
+        lines = text.split('\n')
+        healed = {line: self._merge_line(line, lang) for line in dict.fromkeys(lines)}
+        return "\n".join([healed[line] for line in lines])
+
+    def _merge_tokens(self, line: str, lang: str) -> str:
+        """Dictionary-validated merge of split words within one line."""
+        # Fast path: without a space/tab there is no word pair to merge
+        if ' ' not in line and '\t' not in line:
+            return line
+        
         # We split by whitespace but ensure we can reconstruct.
         # Actually, simpler: Split by Space, process, join. 
         # But we must preserve newlines/punctuation.
         # Use re.split to keep delimiters.
-        tokens = re.split(r'(\s+)', text)
+        tokens = self.re_ws_split.split(line)
         # tokens: ['Plan', ' ', 'B', ' ', 'de', ...]
         
         # We assume ' ' or similar are separators.
@@ -236,7 +316,7 @@ class TextHealer:
                 
                 # If t1 is not a word, just append
                 # Check if it has word chars
-                if not re.search(r'[a-zA-ZçğıöşüÇĞİÖŞÜ]', t1):
+                if not self.re_has_letter.search(t1):
                     new_tokens.append(t1)
                     i += 1
                     continue
@@ -248,7 +328,7 @@ class TextHealer:
                     
                     # Ensure sep is just whitespace (no newlines if we want to be safe? or allow line wrap?)
                     # Allow space/tab. Newline might mean paragraph break.
-                    if re.match(r'^[ \t]+$', sep) and re.match(r'^[a-zA-ZçğıöşüÇĞİÖŞÜ]+$', t2):
+                    if self.re_inline_space.match(sep) and self.re_word.match(t2):
                         # Candidate Pair found: t1 + t2
                         merged = t1 + t2
                         
@@ -266,7 +346,7 @@ class TextHealer:
                         
                         if should_merge:
                             # Dictionary Lookup
-                            if self.sym_spell.lookup(merged, Verbosity.TOP, max_edit_distance=0):
+                            if merged in self.vocab:
                                 # Success!
                                 new_tokens.append(merged)
                                 i += 3 # Skip sep and t2
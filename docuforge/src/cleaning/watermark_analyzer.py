@@ -2,12 +2,31 @@
 WatermarkAnalyzer: Frequency-based watermark detection.
 Only removes patterns that appear on >60% of pages (true watermarks).
 """
+import functools
+import os
 import re
+import threading
 from pathlib import Path
-from typing import List, Set
-import pdfplumber
+from typing import Callable, FrozenSet, List, Set, Tuple
+import fitz  # PyMuPDF
 from docuforge.src.core.tag_manager import TagManager
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan  # Optional (x86 only): SIMD multi-literal matching
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# PyMuPDF is not thread-safe, and analyze() runs from several threads at once
+# (file threads and the prefetch thread), so scans read PDFs one at a time.
+_FITZ_LOCK = threading.Lock()
+
 
 class WatermarkAnalyzer:
     """
@@ -21,64 +40,165 @@ class WatermarkAnalyzer:
         self.pdf_path = pdf_path
         self.total_pages = 0
         self.validated_patterns: Set[str] = set()
+        self._validated_lower: FrozenSet[str] = frozenset()
         
     def analyze(self) -> Set[str]:
         """
         Analyze PDF and return set of validated watermark patterns.
         Only patterns that appear on >60% of pages are considered watermarks.
+        Results are cached per (file, mtime, size, user tags), so converting
+        the same unchanged PDF again skips the scan.
         """
         user_tags = TagManager().load_user_tags()
         
         if not user_tags:
             return set()
         
-        # Compile patterns for matching
-        patterns = [(tag, re.compile(re.escape(tag), re.IGNORECASE)) for tag in user_tags]
-        
-        # Count occurrences per pattern
-        pattern_page_counts = {tag: 0 for tag in user_tags}
-        sample_size = 0
-        
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                self.total_pages = len(pdf.pages)
-                
-                if self.total_pages == 0:
-                    return set()
-                
-                # OPTIMIZATION: Sample pages instead of scanning ALL pages
-                # Scan first 10 pages + every 20th page after that
-                sample_indices = list(range(min(10, self.total_pages)))
-                sample_indices += list(range(19, self.total_pages, 20))
-                sample_size = len(set(sample_indices))
-                
-                for idx in set(sample_indices):
-                    if idx >= self.total_pages:
-                        continue
-                    try:
-                        page = pdf.pages[idx]
-                        text = page.extract_text() or ""
-                        
-                        # Check each pattern against this page
-                        for tag, pattern in patterns:
-                            if pattern.search(text):
-                                pattern_page_counts[tag] += 1
-                    except Exception:
-                        continue
-                        
-                # Adjust threshold based on sample size
-                adjusted_threshold = self.WATERMARK_THRESHOLD * (sample_size / self.total_pages) if sample_size < self.total_pages else self.WATERMARK_THRESHOLD
-        except Exception:
+            st = os.stat(self.pdf_path)
+        except OSError:
             return set()
         
-        # Validate: Only keep patterns that appear on >60% of SAMPLED pages
-        for tag, count in pattern_page_counts.items():
-            ratio = count / sample_size if sample_size > 0 else 0
-            if ratio >= self.WATERMARK_THRESHOLD:
-                self.validated_patterns.add(tag)
-        
+        self.total_pages, validated = _scan_cached(
+            str(self.pdf_path), st.st_mtime_ns, st.st_size, frozenset(user_tags)
+        )
+        self.validated_patterns = set(validated)
+        self._validated_lower = frozenset(p.lower() for p in validated)
         return self.validated_patterns
     
     def is_valid_watermark(self, pattern: str) -> bool:
         """Check if a pattern was validated as a true watermark."""
-        return pattern.lower() in {p.lower() for p in self.validated_patterns}
+        return pattern.lower() in self._validated_lower
+
+
+def _scan(pdf_path: str, user_tags: FrozenSet[str]) -> Tuple[int, FrozenSet[str]]:
+    """Sampled frequency scan of the PDF: (page count, validated patterns)."""
+    find_tags = _tag_finder(user_tags)
+    
+    # Count occurrences per pattern
+    pattern_page_counts = {tag: 0 for tag in user_tags}
+    sample_size = 0
+    total_pages = 0
+    
+    try:
+        # PyMuPDF's text extraction runs in C and is far cheaper than
+        # pdfplumber's per-character layout analysis; plain text is all
+        # the tag search needs.
+        with _FITZ_LOCK, fitz.open(pdf_path) as doc:
+            total_pages = doc.page_count
+            
+            if total_pages == 0:
+                return 0, frozenset()
+            
+            # OPTIMIZATION: Sample pages instead of scanning ALL pages
+            # Scan first 10 pages + every 20th page after that
+            sample_indices = list(range(min(10, total_pages)))
+            sample_indices += list(range(19, total_pages, 20))
+            sample_size = len(set(sample_indices))
+            
+            for idx in set(sample_indices):
+                if idx >= total_pages:
+                    continue
+                try:
+                    text = doc[idx].get_text("text") or ""
+                    
+                    for tag in find_tags(text):
+                        pattern_page_counts[tag] += 1
+                except Exception:
+                    continue
+                    
+            # Adjust threshold based on sample size
+            adjusted_threshold = WatermarkAnalyzer.WATERMARK_THRESHOLD * (sample_size / total_pages) if sample_size < total_pages else WatermarkAnalyzer.WATERMARK_THRESHOLD
+    except Exception:
+        return 0, frozenset()
+    
+    # Validate: Only keep patterns that appear on >60% of SAMPLED pages
+    validated = set()
+    for tag, count in pattern_page_counts.items():
+        ratio = count / sample_size if sample_size > 0 else 0
+        if ratio >= WatermarkAnalyzer.WATERMARK_THRESHOLD:
+            validated.add(tag)
+    
+    return total_pages, frozenset(validated)
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_cached(pdf_path: str, mtime_ns: int, size: int, user_tags: FrozenSet[str]) -> Tuple[int, FrozenSet[str]]:
+    """_scan memoized on the file's identity (mtime/size invalidate edited files)."""
+    return _scan(pdf_path, user_tags)
+
+
+def _tag_finder(user_tags: FrozenSet[str]) -> Callable[[str], Set[str]]:
+    """Fastest available matcher returning the user tags present in a text."""
+    if HYPERSCAN_AVAILABLE:
+        try:
+            return _hyperscan_finder(user_tags)
+        except hyperscan.error:
+            pass  # A tag Hyperscan can't compile - use the next matcher
+    if AHOCORASICK_AVAILABLE:
+        return _aho_corasick_finder(user_tags)
+    return _regex_finder(user_tags)
+
+
+def _hyperscan_finder(user_tags: FrozenSet[str]) -> Callable[[str], Set[str]]:
+    """Tags present in a text, found with one Hyperscan database scan."""
+    # HS_FLAG_CASELESS only folds ASCII, so (like Aho-Corasick) tags and text
+    # are lower-cased instead. SINGLEMATCH reports each tag once per scan.
+    tags = sorted(user_tags)
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(tag.lower()).encode("utf-8") for tag in tags],
+        ids=list(range(len(tags))),
+        flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH] * len(tags),
+    )
+    
+    def find_tags(text: str) -> Set[str]:
+        hits = set()
+        
+        def on_match(tag_id, start, end, flags, context):
+            hits.add(tags[tag_id])
+        db.scan(text.lower().encode("utf-8"), match_event_handler=on_match)
+        return hits
+    return find_tags
+
+
+def _aho_corasick_finder(user_tags: FrozenSet[str]) -> Callable[[str], Set[str]]:
+    """Tags present in a text, found with one Aho-Corasick trie walk (overlaps included)."""
+    automaton = ahocorasick.Automaton()
+    for tag in user_tags:
+        key = tag.lower()
+        automaton.add_word(key, automaton.get(key, ()) + (tag,))
+    automaton.make_automaton()
+    
+    def find_tags(text: str) -> Set[str]:
+        return {tag for _, found in automaton.iter(text.lower()) for tag in found}
+    return find_tags
+
+
+def _regex_finder(user_tags: FrozenSet[str]) -> Callable[[str], Set[str]]:
+    """Tags present in a text, found with one union-regex scan."""
+    # The named group that matched identifies the tag
+    tags = sorted(user_tags)
+    group_tag = {f"t{i}": tag for i, tag in enumerate(tags)}
+    combined = re.compile("|".join(f"(?P<t{i}>{re.escape(tag)})" for i, tag in enumerate(tags)), re.IGNORECASE)
+    # finditer reports non-overlapping matches only, so a tag whose occurrence
+    # overlaps another tag's match can be hidden by it. Those tags are
+    # searched separately, only when a tag they can overlap was found.
+    patterns = {tag: re.compile(re.escape(tag), re.IGNORECASE) for tag in tags}
+    shadowed_by = {tag: [other for other in tags if other != tag and _can_overlap(tag, other)] for tag in tags}
+    
+    def find_tags(text: str) -> Set[str]:
+        found = {group_tag[m.lastgroup] for m in combined.finditer(text)}
+        for tag in tags:
+            if tag not in found and any(other in found for other in shadowed_by[tag]) and patterns[tag].search(text):
+                found.add(tag)
+        return found
+    return find_tags
+
+
+def _can_overlap(a: str, b: str) -> bool:
+    """True if occurrences of the literal tags a and b can overlap in a text."""
+    a, b = a.lower(), b.lower()
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b))))
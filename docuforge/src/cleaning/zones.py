@@ -1,5 +1,6 @@
 from typing import List, Tuple
 import pdfplumber
+from pdfplumber.utils import crop_to_bbox, extract_text
 from docuforge.src.core.config import CleaningConfig
 
 class ZoneCleaner:
@@ -22,6 +23,20 @@ class ZoneCleaner:
         # We start from top_cutoff and go to bottom_cutoff
         return (0, top_cutoff, width, bottom_cutoff)
 
+    @staticmethod
+    def crop_chars(page: pdfplumber.page.Page, bbox: Tuple[float, float, float, float]) -> List[dict]:
+        """
+        Same chars as page.crop(bbox).chars, without building a CroppedPage
+        (which crops every object type on the page, not just the chars).
+        Where page.crop would reject the bbox (not fully inside the page, or
+        zero area) all chars of the page are returned.
+        """
+        x0, top, x1, bottom = bbox
+        px0, ptop, px1, pbottom = page.bbox
+        if x1 <= x0 or bottom <= top or x0 < px0 or top < ptop or x1 > px1 or bottom > pbottom:
+            return page.chars
+        return crop_to_bbox(page.chars, bbox)
+
     def filter_text_by_zone(self, page: pdfplumber.page.Page) -> str:
         """
         Extracts text only from the safe zone.
@@ -32,8 +47,7 @@ class ZoneCleaner:
         # pdfplumber uses (x0, top, x1, bottom) where (0,0) is top-left usually.
         
         try:
-            cropped = page.crop(bbox=crop_box)
-            return cropped.extract_text() or ""
+            return extract_text(self.crop_chars(page, crop_box)) or ""
         except Exception as e:
             # Fallback if cropping fails (e.g. empty page)
             return ""
@@ -1,9 +1,16 @@
+import copy
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Optional, Tuple
 from pydantic import BaseModel, Field
 from ruamel.yaml import YAML
 
 yaml = YAML()
+# Loading only needs plain data: the safe loader uses ruamel's C extension
+# when it is available (the round-trip instance above is kept for dumping).
+yaml_safe = YAML(typ="safe")
+
+# Parsed config files by (path, mtime_ns, size); an edited file is re-read
+_CONFIG_DATA_CACHE: Dict[Tuple[str, int, int], dict] = {}
 
 class OCRConfig(BaseModel):
     enable: str = "auto"  # auto, on, off
@@ -16,7 +23,6 @@ class CleaningConfig(BaseModel):
     repeated_text_ratio: float = 0.6
     header_top_percent: float = 0.02 # Reduced from 0.10 to prevent cutting valid text
     footer_bottom_percent: float = 0.05 # Reduced for safety
-    regex_blacklist: List[str] = []  # Empty by default - user adds watermarks via CLI/Web
 
 class ExtractionConfig(BaseModel):
     tables_enabled: bool = True
@@ -44,11 +50,18 @@ class AppConfig(BaseModel):
 
     @classmethod
     def load(cls, path: Path) -> "AppConfig":
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:
             return cls()
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.load(f) or {}
-        return cls(**data)
+        key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        data = _CONFIG_DATA_CACHE.get(key)
+        if data is None:
+            with open(path, "r", encoding="utf-8") as f:
+                data = yaml_safe.load(f) or {}
+            _CONFIG_DATA_CACHE[key] = data
+        # Callers mutate the returned config, so always build a fresh model
+        return cls(**copy.deepcopy(data))
 
     def save(self, path: Path):
         # Dump model to dict then to yaml
@@ -1,22 +1,238 @@
+import gc
 import logging
+import multiprocessing
+import os
+import signal
+import sys
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional, List, Tuple
-import pdfplumber
+from loguru import logger
 
 from docuforge.src.core.config import AppConfig
 from docuforge.src.ingestion.loader import PDFChunk
 from docuforge.src.core.utils import ensure_windows_temp_compatibility, SafeFileManager
+from docuforge.debug import debug_log, is_debug_enabled
 
 # Lazy imports to avoid circular dependencies/performance hit at startup
 # These will be imported inside the worker process
 
+# Heavy dependencies imported once by the forkserver (POSIX only).
+# Every worker forked from it inherits them instead of re-importing.
+FORKSERVER_PRELOAD = ["numpy", "pdfplumber", "camelot", "cv2", "fitz", "pdfminer.high_level", "symspellpy"]
+
+# Third-party modules workers import up front in the pool initializer
+# so the first chunk on each worker doesn't pay for it.
+WORKER_WARM_IMPORTS = ["pdfplumber", "fitz", "numpy"]
+
+# Tasks a worker runs before it is replaced by a fresh process (Python 3.11+).
+WORKER_MAX_TASKS = 64
+
+# Engine classes used by process_chunk and the module that defines each.
+# Resolved lazily (process_chunk and the warm-up only import engines the
+# config enables) and memoized per worker in _WORKER_STATE, so later chunks
+# skip the import machinery entirely.
+ENGINE_MODULES = {
+    "ZoneCleaner": "docuforge.src.cleaning.zones",
+    "TextCleaner": "docuforge.src.cleaning.artifacts",
+    "StructureExtractor": "docuforge.src.extraction.structure",
+    "TableExtractor": "docuforge.src.extraction.tables",
+    "NeuralSpatialEngine": "docuforge.src.extraction.engine_neural",
+    "ImageExtractor": "docuforge.src.extraction.images",
+    "VisualExtractor": "docuforge.src.extraction.visuals",
+    "SmartOCR": "docuforge.src.ingestion.ocr",
+}
+_WORKER_STATE: dict = {}
+
+# Per-process OCR engine, reused by every chunk this worker handles
+_WORKER_OCR = None
+
+# Per-process engine instances: name -> (constructor args, instance)
+_WORKER_ENGINES: dict = {}
+
+# AppConfig handed to each worker once through the pool initializer
+_WORKER_CONFIG: Optional[AppConfig] = None
+
+# Number of workers in this worker's pool (set by the pool initializer)
+_WORKER_POOL_SIZE: Optional[int] = None
+
+# Per-process background thread for the PyMuPDF image/chart extractors
+_WORKER_IO_POOL: Optional[ThreadPoolExecutor] = None
+
+
+class _StderrFilter:
+    """Filter stderr to suppress pdfminer noise."""
+    def __init__(self, original):
+        self.original = original
+    def write(self, msg):
+        if 'Cannot set gray' not in msg and 'non-stroke' not in msg:
+            self.original.write(msg)
+    def flush(self):
+        self.original.flush()
+
+
 class PipelineController:
     """
     Centralized controller for processing PDF chunks.
     Ensures that CLI, Web API, and Workers use the IDENTICAL logic.
     """
     
+    @staticmethod
+    def get_mp_context():
+        """
+        Multiprocessing context for worker pools.
+        POSIX: 'forkserver' - workers fork from a small pre-imported server
+        instead of CoW-cloning the (large) parent process.
+        Windows: 'spawn' (the only supported method).
+        """
+        if sys.platform == "win32":
+            return multiprocessing.get_context("spawn")
+        
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+        return ctx
+
+    @staticmethod
+    def create_executor(max_workers: int, config: Optional[AppConfig] = None) -> ProcessPoolExecutor:
+        """
+        Create the worker pool used by CLI and Web API.
+        Worker environment setup runs once per process via the initializer.
+        If config is given it is pickled once per worker (not once per chunk);
+        submit process_shared_chunk to use it.
+        """
+        kwargs = {}
+        if sys.version_info >= (3, 11):
+            # Recycle workers so caches/buffers of the native libraries can't
+            # grow without bound over a long batch (the replacement re-runs
+            # the initializer, so it starts warm).
+            kwargs["max_tasks_per_child"] = WORKER_MAX_TASKS
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=PipelineController.get_mp_context(),
+            initializer=PipelineController.worker_init,
+            initargs=(config, max_workers),
+            **kwargs
+        )
+
+    @staticmethod
+    def needs_split_chunks(config: AppConfig) -> bool:
+        """
+        True if chunks should be written as small temp PDFs (PDFLoader split).
+        Camelot tables, the legacy chart extractor and OCR's embedded-image
+        check reopen the chunk's file by path for every page; on a page range
+        of the original PDF each reopen would parse the whole document.
+        """
+        extraction = config.extraction
+        return extraction.tables_enabled or extraction.charts_enabled or config.ocr.enable != 'off'
+
+    @staticmethod
+    def worker_init(config: Optional[AppConfig] = None, pool_size: Optional[int] = None):
+        """Pool initializer: environment setup plus import/dictionary warm-up."""
+        global _WORKER_CONFIG, _WORKER_POOL_SIZE
+        _WORKER_CONFIG = config
+        _WORKER_POOL_SIZE = pool_size
+        # Every worker runs its own OCR threads: one OpenMP thread per
+        # Tesseract keeps the total near the core count (SmartOCR only sets
+        # its default of 3 if nothing set it before).
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+        if sys.platform != "win32":
+            # Own process group: kill_workers takes the worker and any
+            # tesseract/poppler subprocesses down with one killpg, and a
+            # terminal Ctrl+C reaches only the main process.
+            os.setpgrp()
+        PipelineController.initialize_worker()
+        PipelineController.warm_up_worker()
+
+    @staticmethod
+    def kill_workers(executor: ProcessPoolExecutor):
+        """Kill every worker of the pool immediately, including their subprocesses."""
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        if sys.platform != "win32":
+            for proc in processes:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except OSError:
+                    pass  # Already gone
+            return
+        
+        # Windows has no process groups: walk each worker's subtree
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+        for proc in processes:
+            try:
+                if psutil:
+                    for child in psutil.Process(proc.pid).children(recursive=True):
+                        child.kill()
+                proc.kill()
+            except Exception:
+                pass
+
+    @staticmethod
+    def warm_up_worker():
+        """
+        Import the heavy modules and build the per-process singletons once.
+        Failures are ignored - optional modules simply load (or fail) later
+        exactly as they did before.
+        """
+        import importlib
+        for module_name in WORKER_WARM_IMPORTS:
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                pass
+        for class_name in PipelineController.enabled_engines(_WORKER_CONFIG):
+            try:
+                PipelineController.engine_class(class_name)
+            except Exception:
+                pass
+        
+        # TextHealer is a singleton; building it here loads the SymSpell
+        # dictionaries before the worker's first chunk (StructureExtractor,
+        # which every chunk uses, builds it anyway).
+        try:
+            from docuforge.src.cleaning.healer import TextHealer
+            TextHealer()
+        except Exception:
+            pass
+        
+        # Everything loaded so far lives as long as the worker. Move it to the
+        # permanent generation so the periodic gc.collect() in process_chunk
+        # only walks objects created while processing pages.
+        gc.freeze()
+
+    @staticmethod
+    def enabled_engines(config: Optional[AppConfig]) -> List[str]:
+        """Names of the engines process_chunk builds for this config (all if unknown)."""
+        if config is None:
+            return list(ENGINE_MODULES)
+        extraction = config.extraction
+        names = ["ZoneCleaner", "TextCleaner", "StructureExtractor"]
+        if extraction.tables_enabled:
+            names.append("TableExtractor")
+            if extraction.use_neural_engine:
+                names.append("NeuralSpatialEngine")
+        if extraction.images_enabled:
+            names.append("ImageExtractor")
+        if extraction.charts_enabled:
+            names.append("VisualExtractor")
+        if config.ocr.enable != 'off':
+            names.append("SmartOCR")
+        return names
+
+    @staticmethod
+    def engine_class(name: str):
+        """Engine class by name, imported on first use and memoized per worker."""
+        cls = _WORKER_STATE.get(name)
+        if cls is None:
+            import importlib
+            cls = getattr(importlib.import_module(ENGINE_MODULES[name]), name)
+            _WORKER_STATE[name] = cls
+        return cls
+
     @staticmethod
     def initialize_worker():
         """
@@ -37,20 +253,79 @@ class PipelineController:
         logging.getLogger('fitz').setLevel(logging.CRITICAL)
         
         # Redirect pdfminer stderr output (it uses print directly)
-        import sys
-        import io
-        
-        class StderrFilter:
-            """Filter stderr to suppress pdfminer noise."""
-            def __init__(self, original):
-                self.original = original
-            def write(self, msg):
-                if 'Cannot set gray' not in msg and 'non-stroke' not in msg:
-                    self.original.write(msg)
-            def flush(self):
-                self.original.flush()
-        
-        sys.stderr = StderrFilter(sys.stderr)
+        if not isinstance(sys.stderr, _StderrFilter):
+            sys.stderr = _StderrFilter(sys.stderr)
+
+    @staticmethod
+    def get_io_pool() -> ThreadPoolExecutor:
+        """
+        This worker's single background thread, created on first use.
+        One thread keeps PyMuPDF (not thread-safe) on a single thread at a time.
+        """
+        global _WORKER_IO_POOL
+        if _WORKER_IO_POOL is None:
+            _WORKER_IO_POOL = ThreadPoolExecutor(max_workers=1)
+        return _WORKER_IO_POOL
+
+    @staticmethod
+    def extract_page_visuals(image_extractor, visual_extractor, pdf_path: Path, file_page: int) -> Tuple[List[str], List[str]]:
+        """Image links and chart links for one page (either extractor may be None)."""
+        images_md = image_extractor.extract_images(pdf_path, file_page) if image_extractor else []
+        chart_results = visual_extractor.extract_visuals(pdf_path, file_page) if visual_extractor else []
+        return images_md, [link for link, bbox in chart_results]
+
+    @staticmethod
+    def get_smart_ocr(ocr_config):
+        """
+        Return this worker's SmartOCR, building it on first use.
+        Rebuilt only if a chunk arrives with a different OCR config.
+        """
+        global _WORKER_OCR
+        if _WORKER_OCR is None or _WORKER_OCR.config != ocr_config:
+            _WORKER_OCR = PipelineController.engine_class("SmartOCR")(ocr_config, max_threads=PipelineController.ocr_threads())
+        return _WORKER_OCR
+
+    @staticmethod
+    def ocr_threads() -> int:
+        """
+        OCR threads per worker: the cores shared out across the pool (max 4),
+        so pool_size workers don't start far more Tesseract runs than cores.
+        """
+        if not _WORKER_POOL_SIZE:
+            return 4
+        return max(1, min(4, (os.cpu_count() or 1) // _WORKER_POOL_SIZE))
+
+    @staticmethod
+    def get_engine(name: str, *args, **kwargs):
+        """
+        Return this worker's instance of an engine, building it on first use.
+        Engines keep no per-chunk state, so the instance is reused until a chunk
+        arrives with different constructor arguments (config, output dir, ...).
+        """
+        cached = _WORKER_ENGINES.get(name)
+        if cached is not None and cached[0] == (args, kwargs):
+            return cached[1]
+        engine = PipelineController.engine_class(name)(*args, **kwargs)
+        _WORKER_ENGINES[name] = ((args, kwargs), engine)
+        return engine
+
+    @staticmethod
+    def process_shared_chunk(chunk: PDFChunk, doc_output_dir: Path, validated_watermarks: Optional[set] = None) -> str:
+        """
+        process_chunk using the config the pool was created with.
+        Only the per-chunk arguments travel with each task.
+        """
+        if _WORKER_CONFIG is None:
+            raise RuntimeError("Worker pool was created without a config")
+        return PipelineController.process_chunk(chunk, _WORKER_CONFIG, doc_output_dir, validated_watermarks)
+
+    @staticmethod
+    def process_shared_chunks(chunks: List[PDFChunk], doc_output_dir: Path, validated_watermarks: Optional[set] = None) -> List[str]:
+        """
+        Process several consecutive chunks in one task (one IPC round-trip).
+        Returns one Markdown string per chunk, in order.
+        """
+        return [PipelineController.process_shared_chunk(chunk, doc_output_dir, validated_watermarks) for chunk in chunks]
 
     @staticmethod
     def process_chunk(chunk: PDFChunk, config: AppConfig, doc_output_dir: Path, validated_watermarks: Optional[set] = None) -> str:
@@ -65,87 +340,99 @@ class PipelineController:
             validated_watermarks: Set of watermark patterns validated by WatermarkAnalyzer
                                   (patterns that appear on >60% of pages)
         """
-        # 1. Initialize Worker Environment (Idempotent-ish check)
-        # In ProcessPoolExecutor, this runs every simple task if we don't use an initializer,
-        # but calling it here is safe.
-        PipelineController.initialize_worker()
+        # Worker environment (warning filters, stderr filter) is set up once
+        # by the pool initializer, not per chunk.
 
-        # 2. Local Imports (Prevent pickling issues + Circular deps)
-        # Core modules - always needed
-        from docuforge.src.cleaning.zones import ZoneCleaner
-        from docuforge.src.cleaning.artifacts import TextCleaner
-        from docuforge.src.extraction.structure import StructureExtractor
-        from loguru import logger
+        # 1. Engines (Prevent pickling issues + Circular deps)
+        # Imported and built on first use in this worker, then reused by
+        # later chunks with the same config / document
+        get_engine = PipelineController.get_engine
         
-        # 3. Instantiate Core Engines (always needed)
-        zone_cleaner = ZoneCleaner(config.cleaning)
-        text_cleaner = TextCleaner(config.cleaning, validated_watermarks=validated_watermarks)
-        structure_extractor = StructureExtractor()
+        # 2. Core Engines (always needed)
+        zone_cleaner = get_engine("ZoneCleaner", config.cleaning)
+        text_cleaner = get_engine("TextCleaner", config.cleaning, validated_watermarks=validated_watermarks)
+        structure_extractor = get_engine("StructureExtractor")
         
-        # 4. LAZY LOADING - Only import/instantiate enabled modules
+        # 3. LAZY LOADING - Only import/instantiate enabled modules
         # Tables (Legacy + Neural)
         table_extractor = None
         neural_engine = None
         if config.extraction.tables_enabled:
-            from docuforge.src.extraction.tables import TableExtractor
-            table_extractor = TableExtractor(config.extraction)
+            table_extractor = get_engine("TableExtractor", config.extraction)
             
             if config.extraction.use_neural_engine:
-                from docuforge.src.extraction.engine_neural import NeuralSpatialEngine
-                neural_engine = NeuralSpatialEngine(config.extraction)
+                neural_engine = get_engine("NeuralSpatialEngine", config.extraction)
         
         # Images
         image_extractor = None
         if config.extraction.images_enabled:
-            from docuforge.src.extraction.images import ImageExtractor
-            image_extractor = ImageExtractor(config.extraction, output_dir=doc_output_dir)
+            image_extractor = get_engine("ImageExtractor", config.extraction, output_dir=doc_output_dir)
         
         # Charts/Visuals
         visual_extractor = None
         if config.extraction.charts_enabled:
-            from docuforge.src.extraction.visuals import VisualExtractor
-            visual_extractor = VisualExtractor(config.extraction, output_dir=doc_output_dir)
+            visual_extractor = get_engine("VisualExtractor", config.extraction, output_dir=doc_output_dir)
         
         # OCR (only if not 'off') - CORRECT: use 'enable' not 'mode'
         smart_ocr = None
         if config.ocr.enable != 'off':
-            from docuforge.src.ingestion.ocr import SmartOCR
-            smart_ocr = SmartOCR(config.ocr)
+            smart_ocr = PipelineController.get_smart_ocr(config.ocr)
         
         chunk_md_content = []
+        fitz_doc = None
+        visuals_future = None
+        debug_chunks = is_debug_enabled("chunk_lifecycle")
         
         try:
             # Check chunk file exists (may be deleted by race condition)
-            import time
-            from docuforge.debug import debug_log, is_debug_enabled
-            
             # Debug: Chunk access tracking (guarded)
-            if is_debug_enabled("chunk_lifecycle"):
+            if debug_chunks:
                 debug_log("chunk_lifecycle", "Chunk ACCESSING",
-                    path=str(chunk.temp_path),
-                    exists=chunk.temp_path.exists())
+                    path=str(chunk.pdf_path),
+                    exists=chunk.pdf_path.exists())
             
-            if not chunk.temp_path.exists():
+            if not chunk.pdf_path.exists():
                 # Brief retry - file might still be writing
                 time.sleep(0.5)
-                if not chunk.temp_path.exists():
-                    if is_debug_enabled("chunk_lifecycle"):
+                if not chunk.pdf_path.exists():
+                    if debug_chunks:
                         debug_log("chunk_lifecycle", "Chunk MISSING AFTER RETRY",
-                            path=str(chunk.temp_path))
-                    from loguru import logger
-                    logger.error(f"Chunk file not found: {chunk.temp_path}")
+                            path=str(chunk.pdf_path))
+                    logger.error(f"Chunk file not found: {chunk.pdf_path}")
                     return f"\n\n[ERROR: Chunk file missing for pages {chunk.start_page}-{chunk.end_page}]\n"
             
-            with pdfplumber.open(chunk.temp_path) as pdf:
+            # OCR pre-check for the whole chunk (only needed if OCR is enabled).
+            # Raw text only feeds the OCR decision: PyMuPDF's C-level get_text
+            # avoids a full pdfminer layout pass per page. Pages that need OCR
+            # are then rendered and recognized as one batch.
+            raw_texts = ocr_texts = None
+            if smart_ocr:
+                import fitz
+                fitz_doc = fitz.open(chunk.pdf_path)
+                file_pages = [chunk.page_offset + i + 1 for i in range(len(chunk.page_numbers))]
+                raw_texts = [fitz_doc[p - 1].get_text("text") for p in file_pages]
+                ocr_texts = smart_ocr.process_pages_parallel(chunk.pdf_path, file_pages, raw_texts)
+            
+            # Only this chunk's pages are loaded (whole file for split chunks,
+            # a page range for chunks that point at the original PDF).
+            # Imported here so the main process never loads pdfplumber;
+            # workers already have it from the initializer warm-up.
+            import pdfplumber
+            with pdfplumber.open(chunk.pdf_path, pages=chunk.page_numbers) as pdf:
                 for i, page in enumerate(pdf.pages):
                     page_num = chunk.start_page + i
+                    file_page = chunk.page_offset + i + 1  # 1-indexed page inside chunk.pdf_path
+                    
+                    # Parse the page objects once up front; every extractor below
+                    # receives this same page and hits pdfplumber's per-page cache
+                    _ = page.chars
                     
                     # A. Zone Analysis
                     crop_box = zone_cleaner.get_crop_box(page)
 
                     # B. Smart OCR / Text Extraction (if OCR is enabled)
-                    raw_text_check = page.filter(lambda obj: obj["object_type"] == "char").extract_text() or ""
-                    ocr_text = smart_ocr.process_page(chunk.temp_path, i + 1, raw_text_check) if smart_ocr else None
+                    raw_text_check = raw_texts[i] if smart_ocr else ""
+                    ocr_text = ocr_texts[i] if smart_ocr else None
                     
                     if ocr_text and ocr_text != raw_text_check:
                         # OCR Path
@@ -178,9 +465,25 @@ class PipelineController:
                         except Exception as e:
                             logger.warning(f"Page {page_num}: Neural engine failed, falling back: {e}")
                     
+                    # C3/C4. Image and chart extraction run on the worker's
+                    # background thread while tables and text are extracted
+                    # here: both reopen the file with PyMuPDF and mostly wait
+                    # on image decoding and disk writes. The already-parsed
+                    # page decides first whether there is anything to extract
+                    # (images / enough vector objects to form a chart - same
+                    # threshold VisualExtractor applies before clustering).
+                    has_images = bool(page.images)
+                    vector_count = len(page.rects) + len(page.lines) + len(page.curves) + len(page.images)
+                    page_images = image_extractor if image_extractor and has_images else None
+                    page_charts = visual_extractor if visual_extractor and config.extraction.charts_enabled and not charts_md and vector_count >= 10 else None
+                    if page_images or page_charts:
+                        visuals_future = PipelineController.get_io_pool().submit(
+                            PipelineController.extract_page_visuals, page_images, page_charts, chunk.pdf_path, file_page
+                        )
+                    
                     # C2. Fallback to Legacy Extractor (if Neural found nothing or is disabled)
                     if table_extractor and not tables_md and config.extraction.neural_fallback_to_legacy:
-                        legacy_tables = table_extractor.extract_tables(chunk.temp_path, i + 1, page)
+                        legacy_tables = table_extractor.extract_tables(chunk.pdf_path, file_page, page)
                         tables_md.extend(legacy_tables)
 
                     # B. Structure Extraction (Text) - Now with Masking!
@@ -188,48 +491,50 @@ class PipelineController:
                     structured_text = structure_extractor.extract_text_with_structure(page, crop_box, ignore_regions)
                     clean_text = text_cleaner.clean_text(structured_text)
                     
-                    # C3. Image Extraction (if enabled)
-                    images_md = image_extractor.extract_images(chunk.temp_path, i + 1) if image_extractor else []
-                    
-                    # C4. Chart Extraction (legacy visual extractor, if enabled and loaded)
-                    if visual_extractor and config.extraction.charts_enabled and not charts_md:
-                        chart_results = visual_extractor.extract_visuals(chunk.temp_path, i + 1)
-                        charts_md.extend([link for link, bbox in chart_results])
+                    images_md = []
+                    if visuals_future is not None:
+                        images_md, chart_links = visuals_future.result()
+                        visuals_future = None
+                        charts_md.extend(chart_links)
 
                     # D. Assembly
-                    page_md = f"\n\n## Page {page_num}\n"
-                    if charts_md: page_md += "\n" + "\n".join(charts_md) + "\n"
-                    if images_md: page_md += "\n" + "\n".join(images_md) + "\n"
-                    if tables_md: page_md += "\n" + "\n".join(tables_md) + "\n"
-                    page_md += f"\n{clean_text}\n"
+                    parts = [f"\n\n## Page {page_num}\n"]
+                    if charts_md: parts.extend(("\n", "\n".join(charts_md), "\n"))
+                    if images_md: parts.extend(("\n", "\n".join(images_md), "\n"))
+                    if tables_md: parts.extend(("\n", "\n".join(tables_md), "\n"))
+                    parts.append(f"\n{clean_text}\n")
                     
-                    chunk_md_content.append(page_md)
+                    chunk_md_content.append("".join(parts))
                     
                     # CRITICAL: Memory cleanup for worker processes
                     del tables_md, charts_md, images_md, ignore_regions
                     del structured_text, clean_text, raw_text_check
                     
-                    # Flush pdfplumber cache to release memory
-                    try:
-                        page.flush_cache()
-                    except:
-                        pass
+                    # Release the page's parsed objects and text map (each page
+                    # is visited once; pdf.pages keeps the Page objects alive)
+                    page.close()
                     
-                    # GC every 5 pages (more aggressive for memory optimization)
+                    # GC every 5 pages (more aggressive for memory optimization);
+                    # cheap since warm_up_worker froze the long-lived objects
                     if (i + 1) % 5 == 0:
-                        import gc
                         gc.collect()
                     
         except Exception as e:
-            from loguru import logger
             logger.error(f"Chunk processing failed for {chunk.source_path} (pages {chunk.start_page}-{chunk.end_page}): {e}")
             return f"\n\n[ERROR: Failed to process pages {chunk.start_page}-{chunk.end_page}: {str(e)}]\n"
         finally:
-            # E. Safe Cleanup
-            from docuforge.debug import debug_log, is_debug_enabled
-            if is_debug_enabled("chunk_lifecycle"):
-                debug_log("chunk_lifecycle", "Chunk CONTROLLER_DELETE", path=str(chunk.temp_path))
-            SafeFileManager.safe_delete(chunk.temp_path)
+            # E. Safe Cleanup (close handles first - Windows locks open files)
+            # A page that failed mid-way may still have extraction running
+            # on the background thread; it holds the file open too.
+            if visuals_future is not None:
+                wait([visuals_future])
+            if fitz_doc is not None:
+                fitz_doc.close()
+            # Only split chunk files are deleted - never the original PDF
+            if chunk.temp_path:
+                if debug_chunks:
+                    debug_log("chunk_lifecycle", "Chunk CONTROLLER_DELETE", path=str(chunk.temp_path))
+                SafeFileManager.safe_delete(chunk.temp_path)
                 
         return "\n".join(chunk_md_content)
 
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional, Union, Literal
+from typing import Annotated, List, Dict, Any, Optional, Union, Literal
 from pydantic import BaseModel, Field
 
 # Enums
@@ -24,8 +24,9 @@ class ImageBlock(BaseBlock):
     path: str # Relative path to assets folder
     caption: Optional[str] = None
 
-# Union Type for Content List
-ContentItem = Union[TextBlock, TableBlock, ImageBlock]
+# Union Type for Content List. Discriminated on `type` so validation picks
+# the block class by lookup instead of trying each member in turn.
+ContentItem = Annotated[Union[TextBlock, TableBlock, ImageBlock], Field(discriminator="type")]
 
 class PageData(BaseModel):
     page_number: int
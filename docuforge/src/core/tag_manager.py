@@ -2,10 +2,17 @@
 # Persistent User Tag Management
 
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 from ruamel.yaml import YAML
 
-yaml = YAML()
+# The tag file is always rewritten whole from a plain dict, so nothing
+# round-trip specific (comments, anchors) needs preserving: the safe
+# loader/dumper is enough and uses ruamel's C extension when present.
+yaml = YAML(typ="safe")
+
+# Parsed tag list by (path, mtime_ns, size); a file saved or edited since
+# (by this or another process) is re-read
+_TAGS_CACHE: Dict[Tuple[str, int, int], List[str]] = {}
 
 
 class TagManager:
@@ -24,15 +31,24 @@ class TagManager:
     
     def load_user_tags(self) -> List[str]:
         """Load user tags from file. Returns empty list if file doesn't exist."""
-        if not self.tags_file.exists():
-            return []
-        
         try:
-            with open(self.tags_file, "r", encoding="utf-8") as f:
-                data = yaml.load(f)
-                return data.get("tags", []) if data else []
-        except Exception:
+            st = self.tags_file.stat()
+        except OSError:
             return []
+        
+        key = (str(self.tags_file), st.st_mtime_ns, st.st_size)
+        tags = _TAGS_CACHE.get(key)
+        if tags is None:
+            try:
+                with open(self.tags_file, "r", encoding="utf-8") as f:
+                    data = yaml.load(f)
+                    tags = (data.get("tags") if data else None) or []
+            except Exception:
+                return []
+            _TAGS_CACHE.clear()
+            _TAGS_CACHE[key] = tags
+        # Callers mutate the returned list (add_tag/remove_tag)
+        return list(tags)
     
     def save_user_tags(self, tags: List[str]):
         """Save user tags to file."""
@@ -26,11 +26,20 @@ def suppress_stderr():
             except Exception:
                 pass
 
+# Per-process flag: the TEMP path never changes during a process lifetime
+_TEMP_FIXED = False
+
 def ensure_windows_temp_compatibility():
     """
     Fixes Windows User Data with Non-ASCII characters (e.g. 'göksel') breaking Camelot/Ghostscript/OpenCV.
     Forces the process to use a safe ASCII path for TEMP.
+    Runs only once per process; later calls return immediately.
     """
+    global _TEMP_FIXED
+    if _TEMP_FIXED:
+        return
+    _TEMP_FIXED = True
+    
     if os.name != 'nt':
         return
 
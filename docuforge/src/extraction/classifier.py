@@ -12,11 +12,12 @@ Distinguishes between:
 Uses geometric analysis (no GPU required).
 """
 
-import math
 from typing import List, Dict, Tuple, Optional, Literal
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
 try:
     import pdfplumber
     PDFPLUMBER_AVAILABLE = True
@@ -33,6 +34,27 @@ except ImportError:
 ContentType = Literal["TABLE", "CHART", "TEXT", "UNKNOWN"]
 
 
+@dataclass
+class ZoneObjects:
+    """
+    Visual objects of a zone, one array per object type.
+    Each row is an object's (x0, y0, x1, y1) box, so counts, angle tests and
+    bounding boxes are computed on whole arrays instead of per-object dicts.
+    """
+    lines: np.ndarray
+    line_angles: np.ndarray  # Degrees (0-90) per line, 90 = vertical
+    rects: np.ndarray
+    curves: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.lines) + len(self.rects) + len(self.curves)
+    
+    @property
+    def boxes(self) -> np.ndarray:
+        """Boxes of all objects, lines first, then rects, then curves."""
+        return np.concatenate((self.lines, self.rects, self.curves))
+
+
 @dataclass
 class Zone:
     """A detected region on a PDF page."""
@@ -42,7 +64,7 @@ class Zone:
     y1: float
     content_type: ContentType
     confidence: float
-    objects: List[Dict]
+    objects: ZoneObjects
     
     @property
     def width(self) -> float:
@@ -104,37 +126,23 @@ class ZoneClassifier:
         curves = page.curves or []
         
         # Step 2: Find zone boundaries (clusters of visual elements)
-        all_objects = []
-        
-        for line in lines:
-            all_objects.append({
-                'type': 'line',
-                'x0': line['x0'], 'y0': line['top'],
-                'x1': line['x1'], 'y1': line['bottom'],
-                'angle': self._calculate_angle(line)
-            })
-        
-        for rect in rects:
-            all_objects.append({
-                'type': 'rect',
-                'x0': rect['x0'], 'y0': rect['top'],
-                'x1': rect['x1'], 'y1': rect['bottom'],
-                'angle': 0
-            })
+        line_boxes = self._to_boxes([(l['x0'], l['top'], l['x1'], l['bottom']) for l in lines])
+        rect_boxes = self._to_boxes([(r['x0'], r['top'], r['x1'], r['bottom']) for r in rects])
         
+        # Curves are typically paths with multiple points: box = point extent
+        curve_rows = []
         for curve in curves:
-            # Curves are typically paths with multiple points
-            if 'pts' in curve:
-                pts = curve['pts']
-                if pts:
-                    xs = [p[0] for p in pts]
-                    ys = [p[1] for p in pts]
-                    all_objects.append({
-                        'type': 'curve',
-                        'x0': min(xs), 'y0': min(ys),
-                        'x1': max(xs), 'y1': max(ys),
-                        'angle': None
-                    })
+            pts = curve.get('pts')
+            if pts:
+                xs, ys = zip(*((p[0], p[1]) for p in pts))
+                curve_rows.append((min(xs), min(ys), max(xs), max(ys)))
+        
+        all_objects = ZoneObjects(
+            lines=line_boxes,
+            line_angles=self._calculate_angles(line_boxes),
+            rects=rect_boxes,
+            curves=self._to_boxes(curve_rows),
+        )
         
         if not all_objects:
             return []
@@ -150,22 +158,27 @@ class ZoneClassifier:
         self.zones = zones
         return zones
     
-    def _calculate_angle(self, line: Dict) -> float:
-        """Calculate angle of a line in degrees (0-180)."""
-        dx = line['x1'] - line['x0']
-        dy = line['bottom'] - line['top']
-        
-        if dx == 0:
-            return 90.0  # Vertical
-        
-        angle = abs(math.degrees(math.atan(dy / dx)))
-        return angle
+    @staticmethod
+    def _to_boxes(rows: List[Tuple[float, float, float, float]]) -> np.ndarray:
+        """(n, 4) array of (x0, y0, x1, y1) rows; shape (0, 4) when empty."""
+        return np.asarray(rows, dtype=np.float64).reshape(-1, 4)
+    
+    @staticmethod
+    def _calculate_angles(line_boxes: np.ndarray) -> np.ndarray:
+        """Angle of each line in degrees (0-90)."""
+        dx = line_boxes[:, 2] - line_boxes[:, 0]
+        dy = line_boxes[:, 3] - line_boxes[:, 1]
+        
+        angles = np.full(len(line_boxes), 90.0)  # Vertical (dx == 0)
+        sloped = dx != 0
+        angles[sloped] = np.degrees(np.arctan(np.abs(dy[sloped] / dx[sloped])))
+        return angles
     
-    def _is_axis_aligned(self, angle: float, tolerance: float = 5.0) -> bool:
-        """Check if angle is horizontal (0°) or vertical (90°) within tolerance."""
-        return angle <= tolerance or abs(angle - 90) <= tolerance
+    def _is_axis_aligned(self, angle, tolerance: float = 5.0):
+        """Check if angle(s) are horizontal (0°) or vertical (90°) within tolerance."""
+        return (angle <= tolerance) | (np.abs(angle - 90) <= tolerance)
     
-    def _cluster_objects(self, objects: List[Dict], 
+    def _cluster_objects(self, objects: ZoneObjects, 
                          page_width: float, page_height: float) -> List[Zone]:
         """
         Group nearby objects into zones using simple spatial clustering.
@@ -177,10 +190,9 @@ class ZoneClassifier:
         # and check if it should be split
         # This is a basic implementation - can be enhanced with DBSCAN
         
-        x0 = min(obj['x0'] for obj in objects)
-        y0 = min(obj['y0'] for obj in objects)
-        x1 = max(obj['x1'] for obj in objects)
-        y1 = max(obj['y1'] for obj in objects)
+        boxes = objects.boxes
+        x0, y0 = (float(v) for v in boxes[:, :2].min(axis=0))
+        x1, y1 = (float(v) for v in boxes[:, 2:].max(axis=0))
         
         # Create single zone for now
         zone = Zone(
@@ -196,7 +208,7 @@ class ZoneClassifier:
         
         return []
     
-    def _classify_zone(self, objects: List[Dict]) -> ContentType:
+    def _classify_zone(self, objects: ZoneObjects) -> ContentType:
         """
         Classify a zone based on its objects.
         
@@ -210,25 +222,17 @@ class ZoneClassifier:
             return "TEXT"
         
         # Count object types
-        curves = [o for o in objects if o['type'] == 'curve']
-        rects = [o for o in objects if o['type'] == 'rect']
-        lines = [o for o in objects if o['type'] == 'line']
-        
-        diagonal_lines = [l for l in lines 
-                         if l['angle'] is not None 
-                         and not self._is_axis_aligned(l['angle'])]
-        axis_lines = [l for l in lines 
-                     if l['angle'] is not None 
-                     and self._is_axis_aligned(l['angle'])]
+        axis_lines = int(self._is_axis_aligned(objects.line_angles).sum())
+        diagonal_lines = len(objects.lines) - axis_lines
         
         # Decision logic
-        if len(curves) > self.CURVE_THRESHOLD:
+        if len(objects.curves) > self.CURVE_THRESHOLD:
             return "CHART"  # Has curves → definitely a chart
         
-        if len(diagonal_lines) > self.DIAGONAL_THRESHOLD:
+        if diagonal_lines > self.DIAGONAL_THRESHOLD:
             return "CHART"  # Many diagonal lines → likely a chart/diagram
         
-        if len(rects) >= self.MIN_RECTS_FOR_TABLE or len(axis_lines) >= 4:
+        if len(objects.rects) >= self.MIN_RECTS_FOR_TABLE or axis_lines >= 4:
             return "TABLE"  # Rectangles or axis-aligned grid → table
         
         return "UNKNOWN"
@@ -238,9 +242,8 @@ class ZoneClassifier:
         if zone.content_type == "UNKNOWN":
             return 0.0
         
-        objects = zone.objects
-        curves = len([o for o in objects if o['type'] == 'curve'])
-        rects = len([o for o in objects if o['type'] == 'rect'])
+        curves = len(zone.objects.curves)
+        rects = len(zone.objects.rects)
         
         if zone.content_type == "CHART":
             # More curves = higher confidence
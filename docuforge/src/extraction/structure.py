@@ -2,6 +2,7 @@ from typing import List, Dict, Any, Tuple
 import pdfplumber
 from collections import Counter
 import unicodedata
+from docuforge.src.cleaning.zones import ZoneCleaner
 
 class StructureExtractor:
     def __init__(self):
@@ -52,13 +53,9 @@ class StructureExtractor:
         This bypasses pdfplumber's word grouping logic completely.
         Returns list of lines, where each line is a dictionary containing text and max_font_size.
         """
-        if crop_box:
-            try:
-                page = page.crop(bbox=crop_box)
-            except Exception:
-                pass
-                
-        chars = page.chars
+        # Only the chars are needed, so they are cropped directly rather than
+        # through page.crop() (see ZoneCleaner.crop_chars)
+        chars = ZoneCleaner.crop_chars(page, crop_box) if crop_box else page.chars
         if not chars:
             return []
             
@@ -63,9 +63,11 @@ class TableExtractor:
                     check_page = pdf_handle.pages[page_num - 1]
             
             if check_page:
-                words = check_page.extract_words()
-                if words:
-                    all_text = ''.join(w.get('text', '') for w in words)
+                # page.chars is the page's cached object parse; extract_words
+                # would run an extra clustering pass over the same characters
+                chars = check_page.chars
+                if chars:
+                    all_text = ''.join(c.get('text', '') for c in chars)
                     if all_text:
                         digit_count = sum(1 for c in all_text if c.isdigit())
                         total_chars = len(all_text.replace(' ', ''))
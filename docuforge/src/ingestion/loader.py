@@ -1,3 +1,4 @@
+import math
 from pathlib import Path
 from typing import Generator, List, Optional
 from dataclasses import dataclass
@@ -9,17 +10,66 @@ class PDFChunk:
     source_path: Path
     start_page: int  # 1-indexed
     end_page: int    # 1-indexed
-    temp_path: Path
+    temp_path: Optional[Path] = None  # Split chunk file; None = pages are read from source_path
+
+    @property
+    def pdf_path(self) -> Path:
+        """File the worker reads: the split chunk file or the original PDF."""
+        return self.temp_path or self.source_path
+
+    @property
+    def page_offset(self) -> int:
+        """Offset of this chunk's first page inside pdf_path (0-indexed)."""
+        return 0 if self.temp_path else self.start_page - 1
+
+    @property
+    def page_numbers(self) -> List[int]:
+        """1-indexed page numbers of this chunk inside pdf_path."""
+        return list(range(self.page_offset + 1, self.page_offset + self.end_page - self.start_page + 2))
 
 class PDFLoader:
-    def __init__(self, chunk_size: int = 2):  # 2 pages per chunk for granular progress
+    def __init__(self, chunk_size: int = 2, split: bool = True):  # 2 pages per chunk for granular progress
+        """
+        Args:
+            chunk_size: Pages per chunk
+            split: True = write each chunk to a temp PDF (pikepdf).
+                   False = yield page ranges of the original PDF (no temp files).
+        """
         self.chunk_size = chunk_size
+        self.split = split
+
+    @staticmethod
+    def balanced_chunk_size(page_count: int, workers: int, max_size: int = 20) -> int:
+        """
+        Pages per chunk giving ~2 chunks per worker, so no worker idles on
+        small PDFs. Capped at max_size to keep per-chunk memory bounded.
+        """
+        return max(1, min(max_size, math.ceil(page_count / (workers * 2))))
+
+    @staticmethod
+    def count_pages(pdf_path: Path) -> int:
+        """Page count of the PDF (0 if it can't be opened)."""
+        try:
+            with pikepdf.open(pdf_path) as pdf:
+                return len(pdf.pages)
+        except Exception as e:
+            logger.debug(f"Could not count pages of {pdf_path}: {e}")
+            return 0
+
+    def count_chunks(self, pdf_path: Path) -> int:
+        """Number of chunks stream_chunks will yield (0 if the PDF can't be opened)."""
+        return -(-self.count_pages(pdf_path) // self.chunk_size)
 
     def stream_chunks(self, pdf_path: Path) -> Generator[PDFChunk, None, None]:
         """
         Yields chunks of the PDF as temporary files to avoid memory overload.
         Uses pikepdf to split efficienty without re-compressing streams.
+        If split is disabled, yields page ranges of the original file instead.
         """
+        if not self.split:
+            yield from self._stream_page_ranges(pdf_path)
+            return
+
         try:
             with pikepdf.open(pdf_path) as pdf:
                 total_pages = len(pdf.pages)
@@ -78,3 +128,24 @@ class PDFLoader:
         except Exception as e:
             logger.error(f"Failed to open PDF {pdf_path}: {e}")
             raise e
+
+    def _stream_page_ranges(self, pdf_path: Path) -> Generator[PDFChunk, None, None]:
+        """
+        Yields page-range chunks pointing at the original PDF.
+        Workers open the source file directly and pick their pages by index,
+        so no chunk files are written or deleted.
+        """
+        try:
+            with pikepdf.open(pdf_path) as pdf:
+                total_pages = len(pdf.pages)
+        except Exception as e:
+            logger.error(f"Failed to open PDF {pdf_path}: {e}")
+            raise e
+
+        for start_idx in range(0, total_pages, self.chunk_size):
+            end_idx = min(start_idx + self.chunk_size, total_pages)
+            yield PDFChunk(
+                source_path=pdf_path,
+                start_page=start_idx + 1,
+                end_page=end_idx
+            )
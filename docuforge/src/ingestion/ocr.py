@@ -24,6 +24,9 @@ class OcrQualityDictionary:
     Validates OCR output by measuring how many words match a known dictionary.
     """
     
+    RE_DIGITS = re.compile(r"[0-9_]+")
+    RE_NON_WORD_RUN = re.compile(r'\W+')
+    
     def __init__(self, wordlist: set = None):
         """Construct a dictionary from a set of words."""
         if wordlist is None:
@@ -49,8 +52,8 @@ class OcrQualityDictionary:
             Ratio of matched words (0.0 to 1.0)
         """
         # Clean text: remove numbers and punctuation
-        text = re.sub(r"[0-9_]+", ' ', ocr_text)
-        text = re.sub(r'\W+', ' ', text)
+        text = self.RE_DIGITS.sub(' ', ocr_text)
+        text = self.RE_NON_WORD_RUN.sub(' ', text)
         
         # Get unique words (min length 3)
         text_words = {w for w in text.split() if len(w) >= 3}
@@ -75,16 +78,66 @@ class SmartOCR:
     
     # Arrow patterns to normalize
     ARROW_PATTERNS = [
-        (r'[-=]+>', '→'),
-        (r'<[-=]+', '←'),
-        (r'\^+', '↑'),
-        (r'v+', '↓'),
-        (r'->+', '→'),
-        (r'<-+', '←'),
+        (re.compile(r'[-=]+>'), '→'),
+        (re.compile(r'<[-=]+'), '←'),
+        (re.compile(r'\^+'), '↑'),
+        (re.compile(r'v+'), '↓'),
+        (re.compile(r'->+'), '→'),
+        (re.compile(r'<-+'), '←'),
+    ]
+    
+    # Common OCR misreads for Turkish: down arrow often misread as 'v'.
+    # Plain substrings, so they are applied with str.replace.
+    TURKISH_ARROW_FIXES = [
+        ('↓e', 've'),      # ve (and)
+        ('↓E', 'VE'),
+        ('↓a', 'va'),      # va- prefix
+        ('a↓', 'av'),      # av- prefix  
+        ('e↓', 'ev'),      # ev (house)
+        ('↓i', 'vi'),
+        ('↓ı', 'vı'),
+        ('↓u', 'vu'),
+        ('↓ü', 'vü'),
+        ('↓o', 'vo'),
+        ('↓ö', 'vö'),
+        ('Ce↓', 'Cev'),    # Cevap
+        ('ha↓a', 'hava'),  # hava
+        ('de↓', 'dev'),    # dev-
+        ('↓ar', 'var'),    # var
+        ('↓er', 'ver'),    # ver
+        ('se↓', 'sev'),    # sev-
+        ('ya↓', 'yav'),    # yav-
+    ]
+    RE_ARROW_BETWEEN_LETTERS = re.compile(r'(\w)↓(\w)')
+    
+    # _clean_ocr_output word checks
+    RE_NON_WORD = re.compile(r'[^\w]')
+    RE_CONSONANT_RUN = re.compile(r'[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]{4,}')
+    RE_MID_CAPS = re.compile(r'[a-z][A-Z]')
+    VALID_SINGLE_CHARS = frozenset('0123456789abcdeişığüöçABCDEİŞIĞÜÖÇ')
+    COMMON_WORDS = frozenset({
+        've', 'bir', 'bu', 'için', 'ile', 'da', 'de', 'ne', 'var', 'olan',
+        'the', 'and', 'for', 'is', 'in', 'to', 'of', 'a', 'an', 'it',
+        'gibi', 'daha', 'çok', 'nasıl', 'neden', 'kadar', 'sonra', 'önce',
+        'olarak', 'arasında', 'üzerinde', 'altında', 'hakkında', 'göre',
+        'olarak', 'ise', 'ya', 'veya', 'hem', 'ancak', 'fakat', 'çünkü',
+        'that', 'this', 'with', 'from', 'have', 'are', 'was', 'were', 'be'
+    })
+    
+    # OCR noise, replaced by a space in this order. The runs of distinct
+    # characters can't interact, so each group is one alternation; the
+    # bracket/pipe pattern stays a separate pass between them because its
+    # \s* absorbs the spaces (and newlines) the passes around it leave.
+    NOISE_PATTERNS = [
+        re.compile(r'[—–\-]{2,}|[\.]{3,}|[\'\"\'\"]{2,}|[\/\\]{2,}'),
+        re.compile(r'\s*[<>{}|]\s*'),
+        re.compile(r'[=]{2,}|[\*]{2,}|[_]{2,}'),
     ]
     
-    def __init__(self, config: OCRConfig):
+    def __init__(self, config: OCRConfig, max_threads: int = 4):
         self.config = config
+        # Concurrent Tesseract runs in process_pages_parallel
+        self.max_threads = max(1, max_threads)
         # Use best models if available
         self._setup_languages()
         self._setup_user_words()
@@ -498,8 +551,8 @@ class SmartOCR:
         if not ocr_tasks:
             return results
         
-        # Parallel OCR processing (max 4 threads)
-        with ThreadPoolExecutor(max_workers=min(4, len(ocr_tasks))) as executor:
+        # Parallel OCR processing (at most max_threads Tesseract runs at once)
+        with ThreadPoolExecutor(max_workers=min(self.max_threads, len(ocr_tasks))) as executor:
             future_to_idx = {
                 executor.submit(self._run_ocr, pdf_path, page_num): idx
                 for idx, page_num in ocr_tasks
@@ -876,38 +929,14 @@ class SmartOCR:
         
         # Fix arrow patterns
         for pattern, replacement in self.ARROW_PATTERNS:
-            result = re.sub(pattern, replacement, result)
-        
-        # Fix common OCR misreads for Turkish
-        # Down arrow often misread as 'v' in Turkish text
-        turkish_fixes = [
-            ('↓e', 've'),      # ve (and)
-            ('↓E', 'VE'),
-            ('↓a', 'va'),      # va- prefix
-            ('a↓', 'av'),      # av- prefix  
-            ('e↓', 'ev'),      # ev (house)
-            ('↓i', 'vi'),
-            ('↓ı', 'vı'),
-            ('↓u', 'vu'),
-            ('↓ü', 'vü'),
-            ('↓o', 'vo'),
-            ('↓ö', 'vö'),
-            ('Ce↓', 'Cev'),    # Cevap
-            ('ha↓a', 'hava'),  # hava
-            ('de↓', 'dev'),    # dev-
-            ('↓ar', 'var'),    # var
-            ('↓er', 'ver'),    # ver
-            ('se↓', 'sev'),    # sev-
-            ('ya↓', 'yav'),    # yav-
-            # General: isolated ↓ between letters likely means v
-            (r'(\w)↓(\w)', r'\1v\2'),
-        ]
+            result = pattern.sub(replacement, result)
         
-        for pattern, replacement in turkish_fixes:
-            if '\\' in pattern:  # regex pattern
-                result = re.sub(pattern, replacement, result)
-            else:
+        # Fix common OCR misreads for Turkish (every fix involves '↓')
+        if '↓' in result:
+            for pattern, replacement in self.TURKISH_ARROW_FIXES:
                 result = result.replace(pattern, replacement)
+            # General: isolated ↓ between letters likely means v
+            result = self.RE_ARROW_BETWEEN_LETTERS.sub(r'\1v\2', result)
         
         return result
     
@@ -917,39 +946,30 @@ class SmartOCR:
             return ""
         
         # Remove noise patterns
-        noise_patterns = [
-            r'[—–\-]{2,}',
-            r'[\.]{3,}',
-            r'[\'\"\'\"]{2,}',
-            r'[\/\\]{2,}',
-            r'\s*[<>{}|]\s*',
-            r'[=]{2,}',
-            r'[\*]{2,}',
-            r'[_]{2,}',
-        ]
-        
         cleaned = text
-        for pattern in noise_patterns:
-            cleaned = re.sub(pattern, ' ', cleaned)
+        for pattern in self.NOISE_PATTERNS:
+            cleaned = pattern.sub(' ', cleaned)
         
         # Process line by line to preserve structure
-        valid_single_chars = set('0123456789abcdeişığüöçABCDEİŞIĞÜÖÇ')
         clean_lines = []
         all_words = []
+        word_lens = []  # Length of each word in all_words without punctuation
         
         for line in cleaned.split('\n'):
             words = line.split()
             meaningful_words = []
             
             for word in words:
-                clean_word = re.sub(r'[^\w]', '', word)
+                clean_word = self.RE_NON_WORD.sub('', word)
                 if len(clean_word) == 0:
                     continue
                 elif len(clean_word) == 1:
-                    if clean_word in valid_single_chars:
+                    if clean_word in self.VALID_SINGLE_CHARS:
                         meaningful_words.append(word)
+                        word_lens.append(1)
                 else:
                     meaningful_words.append(word)
+                    word_lens.append(len(clean_word))
             
             if meaningful_words:
                 clean_lines.append(' '.join(meaningful_words))
@@ -957,7 +977,7 @@ class SmartOCR:
         
         # Check for garbage (too many short words across all lines)
         if len(all_words) > 10:
-            avg_len = sum(len(re.sub(r'[^\w]', '', w)) for w in all_words) / len(all_words)
+            avg_len = sum(word_lens) / len(all_words)
             if avg_len < 2.1:  # Lowered from 2.5 for Turkish
                 return ""
         
@@ -972,12 +992,12 @@ class SmartOCR:
         # Check for gibberish patterns (charts, graphs, random text)
         if result and len(all_words) > 3:
             # Count unusual character sequences (4+ consonants in a row)
-            consonant_runs = re.findall(r'[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]{4,}', result)
+            consonant_runs = self.RE_CONSONANT_RUN.findall(result)
             if len(consonant_runs) > len(all_words) * 0.15:  # Stricter: 0.2 -> 0.15
                 return ""
             
             # Check for too many uppercase in unusual positions
-            words_with_mid_caps = sum(1 for w in all_words if re.search(r'[a-z][A-Z]', w))
+            words_with_mid_caps = sum(1 for w in all_words if self.RE_MID_CAPS.search(w))
             if words_with_mid_caps > len(all_words) * 0.25:  # Stricter: 0.3 -> 0.25
                 return ""
             
@@ -987,7 +1007,7 @@ class SmartOCR:
                 return ""
             
             # NEW: Check for excessive single/double character words (chart labels)
-            very_short = sum(1 for w in all_words if len(re.sub(r'[^\w]', '', w)) <= 2)
+            very_short = sum(1 for n in word_lens if n <= 2)
             if len(all_words) > 15 and very_short > len(all_words) * 0.5:
                 return ""
             
@@ -997,16 +1017,8 @@ class SmartOCR:
                 return ""
             
             # Check for common Turkish/English words - if none found, likely garbage
-            common_words = {
-                've', 'bir', 'bu', 'için', 'ile', 'da', 'de', 'ne', 'var', 'olan',
-                'the', 'and', 'for', 'is', 'in', 'to', 'of', 'a', 'an', 'it',
-                'gibi', 'daha', 'çok', 'nasıl', 'neden', 'kadar', 'sonra', 'önce',
-                'olarak', 'arasında', 'üzerinde', 'altında', 'hakkında', 'göre',
-                'olarak', 'ise', 'ya', 'veya', 'hem', 'ancak', 'fakat', 'çünkü',
-                'that', 'this', 'with', 'from', 'have', 'are', 'was', 'were', 'be'
-            }
             lower_words = [w.lower() for w in all_words if len(w) > 1]
-            common_found = sum(1 for w in lower_words if w in common_words)
+            common_found = sum(1 for w in lower_words if w in self.COMMON_WORDS)
             
             # If text has many words but no common words, likely garbage
             if len(all_words) > 8 and common_found == 0: